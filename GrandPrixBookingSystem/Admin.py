@@ -33,7 +33,9 @@ class Customer(User):
         self._first_name = first_name
         self._last_name = last_name
         self._order_history = []
-        self._discount = 0  # Default discount
+        self._discount_override = None  # Own discount, kept only when it differs from the admin's
+        self._override_version = 0  # Admin discount version the override was set under
+        self._admin = None  # Admin whose sales totals this customer's orders feed
 
     def get_first_name(self): return self._first_name
     def set_first_name(self, first_name): self._first_name = first_name
@@ -44,16 +46,34 @@ class Customer(User):
     def get_order_history(self): return self._order_history
     def set_order_history(self, history): self._order_history = history
 
-    def set_discount(self, discount): self._discount = discount
-    def get_discount(self): return self._discount
+    def set_discount(self, discount):
+        """Set this customer's discount; matching the admin's global discount stores nothing."""
+        if self._admin is not None and discount == self._admin.get_discount():
+            self._discount_override = None
+        else:
+            self._discount_override = discount
+            self._override_version = self._admin.get_discount_version() if self._admin is not None else 0
+
+    def get_discount(self):
+        """Resolve the discount at order time: a current override, else the admin's global discount."""
+        if self._admin is None:
+            return self._discount_override or 0
+        if self._discount_override is not None and self._override_version == self._admin.get_discount_version():
+            return self._discount_override
+        return self._admin.get_discount()
+
+    def get_admin(self): return self._admin
+    def set_admin(self, admin): self._admin = admin
 
     def placeOrder(self, tickets_count, payment_amount):
         """Place an order, apply discount, and save order."""
-        discounted_amount = payment_amount * (1 - self._discount / 100)
+        discounted_amount = payment_amount * (1 - self.get_discount() / 100)
         self._order_history.append({
             "tickets": tickets_count,
             "payment": discounted_amount
         })
+        if self._admin is not None:
+            self._admin.recordSale(tickets_count, discounted_amount)
         return {"status": "Order successful", "paid": discounted_amount}
 
     def get_customer_info(self):
@@ -70,6 +90,7 @@ class Admin(User):
         super().__init__(user_id, username, password, email, phone_number)
         self._staffID = staff_id
         self._discount = 0
+        self._discount_version = 0  # Bumped on every global discount change
         self._customers = []
         self._total_sales = 0
         self._tickets_sold = 0
@@ -78,23 +99,48 @@ class Admin(User):
     def set_staffID(self, staff_id): self._staffID = staff_id
 
     def add_customer(self, customer):
+        """Register a customer and fold any orders they already placed into the totals."""
+        own_discount = customer.get_discount()
         self._customers.append(customer)
+        customer.set_admin(self)
+        customer.set_discount(own_discount)  # Keeps the discount it had until the next global change
+        for order in customer.get_order_history():
+            self.recordSale(order["tickets"], order["payment"])
+
+    def recordSale(self, tickets_count, payment_amount):
+        """Add one order to the running totals (called by Customer.placeOrder)."""
+        self._tickets_sold += tickets_count
+        self._total_sales += payment_amount
 
     def viewAllCustomers(self):
         return self._customers
 
+    def get_discount(self): return self._discount
+    def get_discount_version(self): return self._discount_version
+
     def modifyDiscounts(self, discount):
+        """Change the global discount; customers pick it up lazily when they next order."""
         self._discount = discount
-        for customer in self._customers:
-            customer.set_discount(discount)
+        self._discount_version += 1  # Supersedes every existing per-customer override
         return True
 
-    def trackTicketSales(self):
-        self._tickets_sold = sum(sum(order["tickets"] for order in c.get_order_history()) for c in self._customers)
+    def auditSales(self):
+        """Recompute the totals from every order history; returns True if the running totals matched."""
+        tickets_sold = sum(sum(order["tickets"] for order in c.get_order_history()) for c in self._customers)
+        total_sales = sum(sum(order["payment"] for order in c.get_order_history()) for c in self._customers)
+        matched = tickets_sold == self._tickets_sold and abs(total_sales - self._total_sales) < 0.005
+        self._tickets_sold = tickets_sold
+        self._total_sales = total_sales
+        return matched
+
+    def trackTicketSales(self, audit=False):
+        if audit:
+            self.auditSales()
         return self._tickets_sold
 
-    def viewSalesReport(self):
-        self._total_sales = sum(sum(order["payment"] for order in c.get_order_history()) for c in self._customers)
+    def viewSalesReport(self, audit=False):
+        if audit:
+            self.auditSales()
         return {
             "total_sales": self._total_sales,
             "tickets_sold": self._tickets_sold,
@@ -142,3 +188,27 @@ if __name__ == "__main__":
     # Display number of tickets sold
     print("\nTickets Sold:")
     print(admin.trackTicketSales())
+
+    # Check the running totals against a full recompute
+    print("\nAudit Matches Running Totals:", admin.auditSales())
+
+    # Benchmark: running totals versus a full recompute for 100k customers x 20 orders
+    import time
+    big_admin = Admin(100, "benchadmin", "pass", "bench@email.com", "0500000001", "STAFF100")
+    for i in range(100000):
+        customer = Customer(i, f"user{i}", "pass", f"user{i}@email.com", "0500000000", "First", "Last")
+        big_admin.add_customer(customer)
+        for n in range(20):
+            customer.placeOrder(1 + n % 3, 50 + n)
+
+    start = time.perf_counter()
+    report = big_admin.viewSalesReport()
+    tickets = big_admin.trackTicketSales()
+    running_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    matched = big_admin.auditSales()
+    audit_time = time.perf_counter() - start
+
+    print(f"\nBenchmark (100k customers x 20 orders): {tickets} tickets, {report['total_sales']:.2f} AED")
+    print(f"Running totals: {running_time * 1000:.3f} ms | Full recompute: {audit_time * 1000:.1f} ms | Match: {matched}")
@@ -1,4 +1,5 @@
 from datetime import date  # Importing date class from datetime module to work with dates
+import numpy as np  # Used for bulk card validation
 
 # Define the base Payment class
 class Payment:
@@ -99,13 +100,59 @@ class CreditCardPayment(Payment):
         return self.__cvv
 
     # Validate credit card details (length, digit check, expiry)
-    def validateCard(self):
+    # Pass today to check many cards against the same date
+    def validateCard(self, today=None):
         return (
             len(self.getCardNumber()) == 16 and self.getCardNumber().isdigit() and
             len(self.getCVV()) == 3 and self.getCVV().isdigit() and
-            self.getExpiryDate() > date.today()
+            self.getExpiryDate() > (today or date.today())
         )
 
+    # Luhn checksum of a card number (the last digit checks the others)
+    @staticmethod
+    def luhnCheck(cardNumber):
+        total = 0
+        for position, digit in enumerate(reversed(cardNumber)):
+            value = int(digit) * (2 if position % 2 else 1)
+            total += value - 9 if value > 9 else value
+        return total % 10 == 0
+
+    # Turns equal-length ASCII digit strings into an (n, length) digit array and a validity mask
+    # Strings of another length or with other characters are marked invalid and read as zeros
+    @staticmethod
+    def __digitMatrix(values, length):
+        placeholder = "0" * length
+        valid = np.fromiter((len(value) == length and value.isascii() for value in values), dtype=bool,
+                            count=len(values))
+        joined = "".join(value if ok else placeholder for value, ok in zip(values, valid))
+        digits = np.frombuffer(joined.encode("ascii"), dtype=np.uint8).reshape(len(values), length) - ord("0")
+        valid &= (digits <= 9).all(axis=1)  # uint8 wraps characters below '0' round to large values
+        return digits, valid
+
+    # Validates a batch of cards in one pass: 16 digits passing the Luhn check, a 3-digit CVV
+    # and an expiry date after today (one clock reading for the whole batch)
+    # Takes parallel sequences of card numbers, CVVs and expiry dates; returns a boolean array
+    @classmethod
+    def validateCards(cls, cardNumbers, cvvs, expiryDates, today=None):
+        count = len(cardNumbers)
+        if count == 0:
+            return np.zeros(0, dtype=bool)
+        digits, valid = cls.__digitMatrix(cardNumbers, 16)
+        doubled = digits[:, 0::2] * 2  # Every second digit from the right, starting with the 16th from the right
+        luhnTotal = digits[:, 1::2].sum(axis=1, dtype=np.int64) + (doubled - 9 * (doubled > 9)).sum(axis=1, dtype=np.int64)
+        valid &= luhnTotal % 10 == 0
+        valid &= cls.__digitMatrix(cvvs, 3)[1]
+        expiry = np.fromiter(map(date.toordinal, expiryDates), dtype=np.int64, count=count)
+        valid &= expiry > (today or date.today()).toordinal()
+        return valid
+
+    # validateCards for a batch of CreditCardPayment objects, read through their getters
+    @classmethod
+    def validatePayments(cls, payments, today=None):
+        return cls.validateCards([payment.getCardNumber() for payment in payments],
+                                 [payment.getCVV() for payment in payments],
+                                 [payment.getExpiryDate() for payment in payments], today)
+
     # Override processPayment to include validation
     def processPayment(self):
         if self.validateCard():
@@ -126,32 +173,67 @@ class CreditCardPayment(Payment):
         })
         return details
 
-# Test Case: Salama Alneyadi's Payment
-salama_payment = CreditCardPayment(
-    paymentID=1001,
-    amount=150.0,
-    paymentDate=date(2025, 5, 10),
-    cardNumber="1234567812345678",
-    cardholderName="Salama Alneyadi",
-    expiryDate=date(2026, 6, 1),
-    cvv="123"
-)
-
-print("Salama Alneyadi's Payment")
-print(salama_payment.processPayment())
-print(salama_payment.getPaymentDetails())
-
-# Test Case: Ghazlan Alketbi's Payment
-ghazlan_payment = CreditCardPayment(
-    paymentID=1002,
-    amount=200.0,
-    paymentDate=date(2025, 5, 10),
-    cardNumber="8765432187654321",
-    cardholderName="Ghazlan Alketbi",
-    expiryDate=date(2025, 12, 31),
-    cvv="456"
-)
-
-print("\nGhazlan Alketbi's Payment")
-print(ghazlan_payment.processPayment())
-print(ghazlan_payment.getPaymentDetails())
+if __name__ == "__main__":
+    # Test Case: Salama Alneyadi's Payment
+    salama_payment = CreditCardPayment(
+        paymentID=1001,
+        amount=150.0,
+        paymentDate=date(2025, 5, 10),
+        cardNumber="1234567812345678",
+        cardholderName="Salama Alneyadi",
+        expiryDate=date(2026, 6, 1),
+        cvv="123"
+    )
+
+    print("Salama Alneyadi's Payment")
+    print(salama_payment.processPayment())
+    print(salama_payment.getPaymentDetails())
+
+    # Test Case: Ghazlan Alketbi's Payment
+    ghazlan_payment = CreditCardPayment(
+        paymentID=1002,
+        amount=200.0,
+        paymentDate=date(2025, 5, 10),
+        cardNumber="8765432187654321",
+        cardholderName="Ghazlan Alketbi",
+        expiryDate=date(2025, 12, 31),
+        cvv="456"
+    )
+
+    print("\nGhazlan Alketbi's Payment")
+    print(ghazlan_payment.processPayment())
+    print(ghazlan_payment.getPaymentDetails())
+
+    # Bulk pre-validation of an imported corporate group order
+    import random
+    import time
+
+    def luhnDigit(partial):
+        for last in "0123456789":
+            if CreditCardPayment.luhnCheck(partial + last):
+                return last
+
+    random.seed(23)
+    count = 200000
+    today = date.today()
+    numbers, cvvs, expiries = [], [], []
+    for i in range(count):
+        number = "".join(random.choice("0123456789") for _ in range(15))
+        number += luhnDigit(number) if random.random() < 0.9 else random.choice("0123456789")
+        if random.random() < 0.02:
+            number = number[:random.randint(12, 15)]
+        numbers.append(number)
+        cvvs.append(random.choice(["123", "987", "12", "1a3", "0042"]) if random.random() < 0.05 else f"{random.randint(0, 999):03d}")
+        expiries.append(date(random.randint(today.year - 1, today.year + 5), random.randint(1, 12), 1))
+
+    start = time.perf_counter()
+    expected = [len(n) == 16 and n.isdigit() and CreditCardPayment.luhnCheck(n) and len(c) == 3 and c.isdigit() and e > date.today()
+                for n, c, e in zip(numbers, cvvs, expiries)]
+    loop_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    valid = CreditCardPayment.validateCards(numbers, cvvs, expiries, today)
+    bulk_time = time.perf_counter() - start
+
+    assert valid.tolist() == expected
+    print(f"\n{count} cards, {int(valid.sum())} valid: one by one {loop_time * 1000:.0f} ms | bulk {bulk_time * 1000:.1f} ms")
@@ -1,5 +1,27 @@
+import io      # Used to read stored records through the legacy unpickler
 import pickle  # Used for saving and loading objects in binary format
 import os      # Used to check if the file exists
+import sqlite3  # Used for the keyed user store
+import threading  # Used to share the store's connection between threads
+
+
+USERS_DB = 'users.db'     # SQLite store holding one row per user ID
+USERS_PICKLE = 'users.pkl'  # Old whole-list file, imported into the store on first use
+_connection = None        # Shared connection to the user store
+_lock = threading.RLock()  # One thread at a time uses the shared connection
+
+
+# Reads users pickled by Customer.py run as a script, which saved them as __main__.Customer
+class _LegacyUnpickler(pickle.Unpickler):
+   def find_class(self, module, name):
+       if module == "__main__":
+           module = __name__
+       return super().find_class(module, name)
+
+
+# Function to unpickle one stored user record
+def _load_record(data):
+   return _LegacyUnpickler(io.BytesIO(data)).load()
 
 
 # User class defines basic user information
@@ -54,18 +76,61 @@ class User:
        self._phoneNumber = phone_number
 
 
-# Function to load users from binary file
+# Function to open the user store, creating it from users.pkl the first time
+# The table is created and the old users imported in one transaction, so a failed import
+# leaves no table behind and is tried again on the next run
+# The connection may be used from any thread, but only while holding _lock
+def get_connection():
+   global _connection
+   with _lock:
+       if _connection is None:
+           connection = sqlite3.connect(USERS_DB, check_same_thread=False)
+           with connection:  # Commits the table and the import together, or rolls both back
+               connection.execute("BEGIN")
+               is_new = connection.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'users'").fetchone() is None
+               connection.execute("CREATE TABLE IF NOT EXISTS users (user_id PRIMARY KEY, data BLOB NOT NULL)")
+               if is_new and os.path.exists(USERS_PICKLE):  # Import users saved by the old list format
+                   with open(USERS_PICKLE, 'rb') as file:
+                       old_users = _LegacyUnpickler(file).load()
+                   connection.executemany("INSERT OR REPLACE INTO users VALUES (?, ?)",
+                                          [(user.get_userID(), pickle.dumps(user)) for user in old_users])
+           _connection = connection
+       return _connection
+
+
+# Function to load a single user by ID (None if not stored)
+def load_user(user_id):
+   with _lock:
+       row = get_connection().execute("SELECT data FROM users WHERE user_id = ?", (user_id,)).fetchone()
+   return _load_record(row[0]) if row else None
+
+
+# Function to insert or overwrite a single user's record
+def save_user(user):
+   data = pickle.dumps(user)
+   with _lock, get_connection() as connection:  # Commits the single-row write
+       connection.execute("INSERT OR REPLACE INTO users VALUES (?, ?)", (user.get_userID(), data))
+
+
+# Function to delete a single user's record
+def delete_user(user_id):
+   with _lock, get_connection() as connection:
+       connection.execute("DELETE FROM users WHERE user_id = ?", (user_id,))
+
+
+# Function to load all users from the store
 def load_users():
-   if os.path.exists('users.pkl'):  # Check if file exists
-       with open('users.pkl', 'rb') as file:  # Open file in read-binary mode
-           return pickle.load(file)           # Load and return user list
-   return []  # Return empty list if file does not exist
+   with _lock:
+       rows = get_connection().execute("SELECT data FROM users ORDER BY rowid").fetchall()
+   return [_load_record(row[0]) for row in rows]  # Return empty list if nothing is stored
 
 
-# Function to save user list to binary file
+# Function to replace every stored user with the given list
 def save_users(users):
-   with open('users.pkl', 'wb') as file:  # Open file in write-binary mode
-       pickle.dump(users, file)           # Save the users list
+   rows = [(user.get_userID(), pickle.dumps(user)) for user in users]
+   with _lock, get_connection() as connection:
+       connection.execute("DELETE FROM users")
+       connection.executemany("INSERT OR REPLACE INTO users VALUES (?, ?)", rows)
 
 
 # Customer class extends User and adds more attributes
@@ -112,9 +177,7 @@ class Customer(User):
            self.set_last_name(details.get('last_name', self._last_name))  # Update last name if provided
 
 
-           users = load_users()  # Load current users
-           users.append(self)    # Add this customer
-           save_users(users)     # Save updated users list
+           save_user(self)  # Store this customer under its user ID
            return True
        except Exception as e:
            print(f"Error creating account: {e}")  # Print error message
@@ -143,12 +206,7 @@ class Customer(User):
            self.set_last_name(details.get('last_name', self._last_name))  # Update last name
 
 
-           users = load_users()  # Load all users
-           for i, user in enumerate(users):  # Loop to find this user
-               if user.get_userID() == self.get_userID():
-                   users[i] = self  # Replace with updated user
-                   break
-           save_users(users)  # Save updated list
+           save_user(self)  # Overwrite only this user's record
            return True
        except Exception as e:
            print(f"Error modifying account: {e}")  # Print error message
@@ -158,9 +216,7 @@ class Customer(User):
    # Method to delete the current account
    def deleteAccount(self):
        try:
-           users = load_users()  # Load current users
-           users = [user for user in users if user.get_userID() != self.get_userID()]  # Remove this user
-           save_users(users)  # Save updated users list
+           delete_user(self.get_userID())  # Remove only this user's record
            return True
        except Exception as e:
            print(f"Error deleting account: {e}")  # Print error message
@@ -185,12 +241,7 @@ class Customer(User):
            self.set_order_history(self.get_order_history() + [order])  # Add to order history
 
 
-           users = load_users()  # Load all users
-           for i, user in enumerate(users):  # Find and update this user
-               if user.get_userID() == self.get_userID():
-                   users[i] = self  # Update user
-                   break
-           save_users(users)  # Save updated list
+           save_user(self)  # Update only this user's record
            return order
        except Exception as e:
            print(f"Error placing order: {e}")  # Print error message
@@ -258,4 +309,9 @@ if __name__ == "__main__":
 
    # View Ghazlan’s order history
    print("\nGhazlan's order history:")
-   print(ghazlan.viewOrderHistory())
\ No newline at end of file
+   print(ghazlan.viewOrderHistory())
+
+
+   # Read a single record back from the store by user ID
+   print("\nStored record for user 1:")
+   print(load_user(1).viewAccount())
\ No newline at end of file
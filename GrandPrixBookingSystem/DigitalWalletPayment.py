@@ -92,43 +92,44 @@ class DigitalWalletPayment(Payment):
         })
         return details
 
-# Create a DigitalWalletPayment object for Salama Alneyadi
-salama_wallet_payment = DigitalWalletPayment(
-    paymentID=2001,  # Payment ID
-    amount=150.0,  # Payment amount
-    paymentDate=date(2025, 5, 10),  # Payment date
-    walletID="wallet123456",  # Wallet ID
-    provider="PayPal"  # Provider name
-)
-
-# Create a DigitalWalletPayment object for Ghazlan Alketbi
-ghazlan_wallet_payment = DigitalWalletPayment(
-    paymentID=2002,  # Payment ID
-    amount=200.0,  # Payment amount
-    paymentDate=date(2025, 5, 10),  # Payment date
-    walletID="wallet654321",  # Wallet ID
-    provider="Apple Pay"  # Provider name
-)
-
-# Print Salama's payment result
-print(f"Salama Alneyadi's Digital Wallet Payment:")  # Header
-print(salama_wallet_payment.processPayment())  # Print processing message
-print(salama_wallet_payment.getPaymentDetails())  # Print payment details
-
-# Print Ghazlan's payment result
-print(f"\nGhazlan Alketbi's Digital Wallet Payment:")  # Header
-print(ghazlan_wallet_payment.processPayment())  # Print processing message
-print(ghazlan_wallet_payment.getPaymentDetails())  # Print payment details
-
-# Save the payment objects to a pickle file
-with open("wallet_payments.pkl", "wb") as file:
-    pickle.dump([salama_wallet_payment, ghazlan_wallet_payment], file)
-
-# Load the payment objects back from the pickle file
-with open("wallet_payments.pkl", "rb") as file:
-    loaded_payments = pickle.load(file)
-
-# Print loaded payment details to verify
-print("\nLoaded Payment Details from Pickle File:")
-for payment in loaded_payments:
-    print(payment.getPaymentDetails())
+if __name__ == "__main__":
+    # Create a DigitalWalletPayment object for Salama Alneyadi
+    salama_wallet_payment = DigitalWalletPayment(
+        paymentID=2001,  # Payment ID
+        amount=150.0,  # Payment amount
+        paymentDate=date(2025, 5, 10),  # Payment date
+        walletID="wallet123456",  # Wallet ID
+        provider="PayPal"  # Provider name
+    )
+
+    # Create a DigitalWalletPayment object for Ghazlan Alketbi
+    ghazlan_wallet_payment = DigitalWalletPayment(
+        paymentID=2002,  # Payment ID
+        amount=200.0,  # Payment amount
+        paymentDate=date(2025, 5, 10),  # Payment date
+        walletID="wallet654321",  # Wallet ID
+        provider="Apple Pay"  # Provider name
+    )
+
+    # Print Salama's payment result
+    print(f"Salama Alneyadi's Digital Wallet Payment:")  # Header
+    print(salama_wallet_payment.processPayment())  # Print processing message
+    print(salama_wallet_payment.getPaymentDetails())  # Print payment details
+
+    # Print Ghazlan's payment result
+    print(f"\nGhazlan Alketbi's Digital Wallet Payment:")  # Header
+    print(ghazlan_wallet_payment.processPayment())  # Print processing message
+    print(ghazlan_wallet_payment.getPaymentDetails())  # Print payment details
+
+    # Save the payment objects to a pickle file
+    with open("wallet_payments.pkl", "wb") as file:
+        pickle.dump([salama_wallet_payment, ghazlan_wallet_payment], file)
+
+    # Load the payment objects back from the pickle file
+    with open("wallet_payments.pkl", "rb") as file:
+        loaded_payments = pickle.load(file)
+
+    # Print loaded payment details to verify
+    print("\nLoaded Payment Details from Pickle File:")
+    for payment in loaded_payments:
+        print(payment.getPaymentDetails())
@@ -69,8 +69,13 @@ class Order:
     def calculateTotal(self):
         return sum(self.prices)
 
-    def applyDiscount(self, discount):
+    # Pass a PromoRedemptionManager to enforce the code's usage caps
+    def applyDiscount(self, discount, redemptions=None):
         if discount and discount.isValid():
+            if self._discount is not None and self._discount.getDiscountCode() == discount.getDiscountCode():
+                return self._totalAmount  # Already applied; do not count a second redemption
+            if redemptions is not None and not redemptions.redeem(discount.getDiscountCode(), self.customerName):
+                return self._totalAmount
             self._discount = discount
             discounted_total = discount.applyDiscount(self.calculateTotal())
             self._totalAmount = discounted_total
@@ -0,0 +1,204 @@
+from datetime import date
+import pickle
+import os
+import sqlite3
+import Discount as discount_module
+from Discount import Discount
+
+DISCOUNTS_DB = 'discounts.db'         # SQLite store holding one row per discount code
+DISCOUNTS_PICKLE = 'discounts.pkl'    # Old whole-list file, imported into the store on first use
+
+
+# Reads discounts.pkl even when it was written by Discount.py run as a script
+class _LegacyUnpickler(pickle.Unpickler):
+    def find_class(self, module, name):
+        if module == "__main__":
+            module = discount_module.__name__
+        return super().find_class(module, name)
+
+
+# DiscountRegistry class looking discount codes up by code and by validity date
+# Only (code, validFrom, validUntil, isActive) is read at startup to build the indexes;
+# a Discount object is loaded from the store the first time its code is asked for.
+# Validity windows are kept sorted by validFrom with the latest validUntil of every subtree,
+# so "active on date D" skips whole ranges that cannot contain D (O(log n + matches)).
+class DiscountRegistry:
+    # legacyFilename is the old discounts.pkl to import; by default it sits next to the store
+    def __init__(self, filename=DISCOUNTS_DB, legacyFilename=None):
+        if legacyFilename is None:
+            legacyFilename = os.path.join(os.path.dirname(filename), DISCOUNTS_PICKLE)
+        self.__connection = sqlite3.connect(filename, check_same_thread=False)
+        # The table is created and the old discounts imported in one transaction, so a failed import
+        # leaves no table behind and is tried again on the next open
+        with self.__connection:
+            self.__connection.execute("BEGIN")
+            isNew = self.__connection.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'discounts'").fetchone() is None
+            self.__connection.execute("CREATE TABLE IF NOT EXISTS discounts (code TEXT PRIMARY KEY, percentage REAL NOT NULL, "
+                                      "valid_from TEXT NOT NULL, valid_until TEXT NOT NULL, is_active INTEGER NOT NULL)")
+            if isNew and os.path.exists(legacyFilename):  # Import discounts saved by the old list format
+                with open(legacyFilename, 'rb') as file:
+                    oldDiscounts = _LegacyUnpickler(file).load()
+                self.__connection.executemany("INSERT OR REPLACE INTO discounts VALUES (?, ?, ?, ?, ?)",
+                                              [self.__toRow(discount) for discount in oldDiscounts])
+        self.__windows = {}   # code -> (validFrom, validUntil, isActive)
+        self.__loaded = {}    # code -> Discount already loaded from the store
+        for code, validFrom, validUntil, isActive in self.__connection.execute(
+                "SELECT code, valid_from, valid_until, is_active FROM discounts"):
+            self.__windows[code] = (date.fromisoformat(validFrom), date.fromisoformat(validUntil), bool(isActive))
+        self.__dirty = True
+
+    @staticmethod
+    def __toRow(discount):
+        return (discount.getDiscountCode(), discount.getDiscountPercentage(), discount.getValidFrom().isoformat(),
+                discount.getValidUntil().isoformat(), 1 if discount.getIsActive() else 0)
+
+    # Adds or replaces a discount and writes it to the store
+    def save(self, discount):
+        with self.__connection:
+            self.__connection.execute("INSERT OR REPLACE INTO discounts VALUES (?, ?, ?, ?, ?)", self.__toRow(discount))
+        code = discount.getDiscountCode()
+        self.__windows[code] = (discount.getValidFrom(), discount.getValidUntil(), bool(discount.getIsActive()))
+        self.__loaded[code] = discount
+        self.__dirty = True
+
+    # Removes a discount code; returns False if it was not registered
+    def remove(self, code):
+        if code not in self.__windows:
+            return False
+        with self.__connection:
+            self.__connection.execute("DELETE FROM discounts WHERE code = ?", (code,))
+        del self.__windows[code]
+        self.__loaded.pop(code, None)
+        self.__dirty = True
+        return True
+
+    # Returns the Discount for a code (None if unknown)
+    def get(self, code):
+        if code not in self.__windows:
+            return None
+        discount = self.__loaded.get(code)
+        if discount is None:
+            row = self.__connection.execute("SELECT code, percentage, valid_from, valid_until, is_active FROM discounts "
+                                            "WHERE code = ?", (code,)).fetchone()
+            discount = Discount(row[0], row[1], date.fromisoformat(row[2]), date.fromisoformat(row[3]), bool(row[4]))
+            self.__loaded[code] = discount
+        return discount
+
+    def __contains__(self, code):
+        return code in self.__windows
+
+    def __len__(self):
+        return len(self.__windows)
+
+    # True if the code exists, is active and onDate (today by default) is inside its window
+    def isValid(self, code, onDate=None):
+        window = self.__windows.get(code)
+        if window is None:
+            return False
+        validFrom, validUntil, isActive = window
+        return isActive and validFrom <= (onDate or date.today()) <= validUntil
+
+    # Returns the Discount for a code if it can be used on onDate, otherwise None
+    def getValidDiscount(self, code, onDate=None):
+        return self.get(code) if self.isValid(code, onDate) else None
+
+    # Rebuilds the sorted windows and subtree maxima after codes were saved or removed
+    def __buildIntervals(self):
+        entries = sorted((validFrom, validUntil, code) for code, (validFrom, validUntil, isActive)
+                         in self.__windows.items() if isActive)
+        self.__starts = [validFrom for validFrom, _, _ in entries]
+        self.__ends = [validUntil for _, validUntil, _ in entries]
+        self.__codes = [code for _, _, code in entries]
+        self.__maxEnds = list(self.__ends)
+        if entries:
+            self.__fillMaxEnds(0, len(entries))
+        self.__dirty = False
+
+    # The ranges form an implicit balanced tree: the middle entry is the root of [low, high)
+    def __fillMaxEnds(self, low, high):
+        middle = (low + high) // 2
+        latest = self.__ends[middle]
+        if low < middle:
+            latest = max(latest, self.__fillMaxEnds(low, middle))
+        if middle + 1 < high:
+            latest = max(latest, self.__fillMaxEnds(middle + 1, high))
+        self.__maxEnds[middle] = latest
+        return latest
+
+    # Codes of the discounts usable on onDate (today by default), ordered by validFrom
+    def activeCodesOn(self, onDate=None):
+        if self.__dirty:
+            self.__buildIntervals()
+        onDate = onDate or date.today()
+        found = []
+        ranges = [(0, len(self.__codes))]
+        while ranges:
+            low, high = ranges.pop()
+            if low >= high:
+                continue
+            middle = (low + high) // 2
+            if self.__maxEnds[middle] < onDate:  # Every window in this range ended before onDate
+                continue
+            ranges.append((low, middle))
+            if self.__starts[middle] <= onDate:  # Entries to the right start no earlier than this one
+                if self.__ends[middle] >= onDate:
+                    found.append(middle)
+                ranges.append((middle + 1, high))
+        return [self.__codes[position] for position in sorted(found)]
+
+    # Discounts usable on onDate (today by default)
+    def activeOn(self, onDate=None):
+        return [self.get(code) for code in self.activeCodesOn(onDate)]
+
+    def close(self):
+        self.__connection.close()
+
+
+# Example: register a season of codes, then time checkout lookups against the flat list
+if __name__ == "__main__":
+    import random
+    import tempfile
+    import time
+    from datetime import timedelta
+
+    filename = os.path.join(tempfile.mkdtemp(), DISCOUNTS_DB)
+    registry = DiscountRegistry(filename)
+    registry.save(Discount("EID2025", 15.0, date(2025, 5, 1), date(2025, 5, 31), True))
+    registry.save(Discount("SPRING2025", 20.0, date(2025, 4, 1), date(2025, 4, 30), True))
+    print("EID2025 valid on 2025-05-10?", registry.isValid("EID2025", date(2025, 5, 10)))
+    print("SPRING2025 valid on 2025-05-10?", registry.isValid("SPRING2025", date(2025, 5, 10)))
+
+    random.seed(18)
+    discounts = []
+    for i in range(20000):
+        validFrom = date(2024, 1, 1) + timedelta(days=random.randint(0, 900))
+        discounts.append(Discount(f"CODE{i:05d}", random.choice([5.0, 10.0, 15.0]), validFrom,
+                                  validFrom + timedelta(days=random.randint(1, 60)), random.random() < 0.9))
+    for discount in discounts:
+        registry.save(discount)
+    registry.close()
+
+    start = time.perf_counter()
+    registry = DiscountRegistry(filename)
+    print(f"\nReopened {len(registry)} codes in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    checkDate = date(2025, 3, 15)
+    codes = [f"CODE{random.randint(0, 19999):05d}" for _ in range(2000)]
+
+    start = time.perf_counter()
+    scanned = [next((d for d in discounts if d.getDiscountCode() == code), None) for code in codes]
+    scanned = [d is not None and d.getIsActive() and d.getValidFrom() <= checkDate <= d.getValidUntil() for d in scanned]
+    scanActive = [d.getDiscountCode() for d in discounts
+                  if d.getIsActive() and d.getValidFrom() <= checkDate <= d.getValidUntil()]
+    scanTime = time.perf_counter() - start
+
+    start = time.perf_counter()
+    indexed = [registry.isValid(code, checkDate) for code in codes]
+    active = registry.activeCodesOn(checkDate)
+    indexTime = time.perf_counter() - start
+
+    assert scanned == indexed and sorted(scanActive) == sorted(active)
+    print(f"2000 code checks + active list ({len(active)} codes): list scan {scanTime * 1000:.0f} ms | "
+          f"registry {indexTime * 1000:.2f} ms")
+    print("First active discount on", checkDate, "->", registry.activeOn(checkDate)[0])
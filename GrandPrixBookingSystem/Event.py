@@ -4,6 +4,8 @@ import os
 
 # Event class to manage event information and ticket sales
 class Event:
+    __heldTickets = 0  # Default for events pickled before seat holds existed
+
     def __init__(self, eventID, eventName, eventDate, location, totalCapacity, soldTickets=0):
         # Initialize the event details using setters
         self.setEventID(eventID)
@@ -12,6 +14,7 @@ class Event:
         self.setLocation(location)
         self.setTotalCapacity(totalCapacity)
         self.setSoldTickets(soldTickets)
+        self.setHeldTickets(0)
 
     # Setters and getters for encapsulated event attributes
     def setEventID(self, eventID):
@@ -50,13 +53,37 @@ class Event:
     def getSoldTickets(self):
         return self.__soldTickets
 
-    # Returns the number of tickets still available
+    def setHeldTickets(self, heldTickets):
+        self.__heldTickets = heldTickets
+
+    def getHeldTickets(self):
+        return self.__heldTickets
+
+    # Returns the number of tickets still available (neither sold nor held)
     def getAvailableTickets(self):
-        return self.getTotalCapacity() - self.getSoldTickets()
+        return self.getTotalCapacity() - self.getSoldTickets() - self.getHeldTickets()
+
+    # Holds seats while a customer pays; returns False if not enough are available
+    def holdTickets(self, count):
+        if count > self.getAvailableTickets():
+            return False
+        self.setHeldTickets(self.getHeldTickets() + count)
+        return True
+
+    # Gives held seats back to the available pool
+    def releaseHeldTickets(self, count):
+        self.setHeldTickets(max(self.getHeldTickets() - count, 0))
+
+    # Turns held seats into sold seats once payment succeeds
+    def confirmHeldTickets(self, count):
+        count = min(count, self.getHeldTickets())
+        self.setHeldTickets(self.getHeldTickets() - count)
+        self.setSoldTickets(self.getSoldTickets() + count)
+        return self.getSoldTickets()
 
     # Updates sold ticket count if within capacity, otherwise prints an error
     def updateSoldTickets(self, count):
-        if self.getSoldTickets() + count <= self.getTotalCapacity():
+        if self.getSoldTickets() + self.getHeldTickets() + count <= self.getTotalCapacity():
             self.setSoldTickets(self.getSoldTickets() + count)
         else:
             print("Not enough tickets available!")  # Error message for exceeding capacity
@@ -71,6 +98,7 @@ class Event:
             "Location": self.getLocation(),
             "Total Capacity": self.getTotalCapacity(),
             "Sold Tickets": self.getSoldTickets(),
+            "Held Tickets": self.getHeldTickets(),
             "Available Tickets": self.getAvailableTickets()
         }
 
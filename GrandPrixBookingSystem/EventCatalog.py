@@ -0,0 +1,217 @@
+from datetime import date
+import numpy as np
+from Event import Event, load_events
+
+# EventCatalog class storing event fields in parallel NumPy arrays (one row per event)
+# Availability filters and capacity totals run as vectorized operations over all rows
+class EventCatalog:
+    def __init__(self, initialSize=1024):
+        self.__size = 0
+        self.ids = np.zeros(initialSize, dtype=np.int64)
+        self.dates = np.zeros(initialSize, dtype='datetime64[D]')
+        self.capacity = np.zeros(initialSize, dtype=np.int64)
+        self.sold = np.zeros(initialSize, dtype=np.int64)
+        self.held = np.zeros(initialSize, dtype=np.int64)  # Seats on hold while customers pay
+        self.names = []      # Text fields stay in plain lists
+        self.locations = []
+        self.__views = []    # CatalogEvent view for each row
+        self.__rowsByID = {}
+
+    # Builds a catalog from existing Event objects (for example the output of load_events)
+    @classmethod
+    def fromEvents(cls, events):
+        catalog = cls(max(len(events), 1))
+        for event in events:
+            catalog.addEvent(event.getEventID(), event.getEventName(), event.getEventDate(),
+                             event.getLocation(), event.getTotalCapacity(), event.getSoldTickets(),
+                             event.getHeldTickets())
+        return catalog
+
+    # Loads the pickled event list and converts it to a catalog
+    @classmethod
+    def load(cls, filename='events.pkl'):
+        return cls.fromEvents(load_events(filename))
+
+    # Doubles the arrays when they are full
+    def __grow(self):
+        newSize = max(len(self.ids) * 2, 1)
+        for field in ("ids", "dates", "capacity", "sold", "held"):
+            old = getattr(self, field)
+            grown = np.zeros(newSize, dtype=old.dtype)
+            grown[:self.__size] = old[:self.__size]
+            setattr(self, field, grown)
+
+    # Adds an event row and returns its Event view (duplicate IDs are rejected)
+    def addEvent(self, eventID, eventName, eventDate, location, totalCapacity, soldTickets=0, heldTickets=0):
+        if eventID in self.__rowsByID:
+            return None
+        if self.__size == len(self.ids):
+            self.__grow()
+        row = self.__size
+        self.ids[row] = eventID
+        self.dates[row] = eventDate
+        self.capacity[row] = totalCapacity
+        self.sold[row] = soldTickets
+        self.held[row] = heldTickets
+        self.names.append(eventName)
+        self.locations.append(location)
+        view = CatalogEvent(self, row)
+        self.__views.append(view)
+        self.__rowsByID[eventID] = row
+        self.__size += 1
+        return view
+
+    def __len__(self):
+        return self.__size
+
+    # Returns the Event view for a row
+    def getEvent(self, row):
+        return self.__views[row]
+
+    # Returns the Event view for an event ID, or None
+    def getEventByID(self, eventID):
+        row = self.__rowsByID.get(eventID)
+        return None if row is None else self.__views[row]
+
+    # Keeps the ID lookup in step when a view's ID is changed
+    def _moveID(self, row, oldID, newID):
+        if self.__rowsByID.get(oldID) == row:
+            del self.__rowsByID[oldID]
+        self.__rowsByID[newID] = row
+
+    # Seats left per row (neither sold nor held)
+    def availableTickets(self):
+        return self.capacity[:self.__size] - self.sold[:self.__size] - self.held[:self.__size]
+
+    # Rows matching an optional date window [start, end]
+    def dateMask(self, start=None, end=None):
+        mask = np.ones(self.__size, dtype=bool)
+        if start is not None:
+            mask &= self.dates[:self.__size] >= np.datetime64(start, 'D')
+        if end is not None:
+            mask &= self.dates[:self.__size] <= np.datetime64(end, 'D')
+        return mask
+
+    # Row numbers of events with more than minAvailable seats left
+    def rowsWithAvailability(self, minAvailable, start=None, end=None):
+        return np.flatnonzero((self.availableTickets() > minAvailable) & self.dateMask(start, end))
+
+    # Event views for events with more than minAvailable seats left
+    def eventsWithAvailability(self, minAvailable, start=None, end=None):
+        return [self.__views[row] for row in self.rowsWithAvailability(minAvailable, start, end)]
+
+    # Sold / capacity per row (0 where capacity is 0)
+    def sellThroughRatios(self):
+        capacity = self.capacity[:self.__size]
+        ratios = np.zeros(self.__size, dtype=np.float64)
+        np.divide(self.sold[:self.__size], capacity, out=ratios, where=capacity > 0)
+        return ratios
+
+    # Total seats left over an optional date window
+    def totalRemainingCapacity(self, start=None, end=None):
+        return int(self.availableTickets()[self.dateMask(start, end)].sum())
+
+    # Total seats across an optional date window
+    def totalCapacity(self, start=None, end=None):
+        return int(self.capacity[:self.__size][self.dateMask(start, end)].sum())
+
+    # Converts back to plain Event objects, for example to save with save_events
+    def toEvents(self):
+        events = []
+        for view in self.__views:
+            event = Event(view.getEventID(), view.getEventName(), view.getEventDate(), view.getLocation(),
+                          view.getTotalCapacity(), view.getSoldTickets())
+            event.setHeldTickets(view.getHeldTickets())  # Seats on hold are not a constructor argument
+            events.append(event)
+        return events
+
+
+# Event view whose fields live in an EventCatalog row instead of on the object
+class CatalogEvent(Event):
+    def __init__(self, catalog, row):
+        self._catalog = catalog
+        self._row = row
+
+    def getRow(self):
+        return self._row
+
+    def setEventID(self, eventID):
+        self._catalog._moveID(self._row, self.getEventID(), eventID)
+        self._catalog.ids[self._row] = eventID
+
+    def getEventID(self):
+        return int(self._catalog.ids[self._row])
+
+    def setEventName(self, eventName):
+        self._catalog.names[self._row] = eventName
+
+    def getEventName(self):
+        return self._catalog.names[self._row]
+
+    def setEventDate(self, eventDate):
+        self._catalog.dates[self._row] = eventDate
+
+    def getEventDate(self):
+        return self._catalog.dates[self._row].astype(date)
+
+    def setLocation(self, location):
+        self._catalog.locations[self._row] = location
+
+    def getLocation(self):
+        return self._catalog.locations[self._row]
+
+    def setTotalCapacity(self, totalCapacity):
+        self._catalog.capacity[self._row] = totalCapacity
+
+    def getTotalCapacity(self):
+        return int(self._catalog.capacity[self._row])
+
+    def setSoldTickets(self, soldTickets):
+        self._catalog.sold[self._row] = soldTickets
+
+    def getSoldTickets(self):
+        return int(self._catalog.sold[self._row])
+
+    def setHeldTickets(self, heldTickets):
+        self._catalog.held[self._row] = heldTickets
+
+    def getHeldTickets(self):
+        return int(self._catalog.held[self._row])
+
+
+# Benchmark comparing vectorized catalog queries with a loop over Event objects
+if __name__ == "__main__":
+    import random
+    import time
+    from datetime import timedelta
+
+    random.seed(11)
+    events = []
+    for i in range(100000):
+        capacity = random.randint(500, 20000)
+        events.append(Event(i, f"Race Day {i}", date(2025, 1, 1) + timedelta(days=i % 730),
+                            "Yas Marina Circuit", capacity, random.randint(0, capacity)))
+    catalog = EventCatalog.fromEvents(events)
+    monthStart, monthEnd = date(2025, 11, 1), date(2025, 11, 30)
+
+    start = time.perf_counter()
+    loopAvailable = [e for e in events if e.getAvailableTickets() > 5000]
+    loopRemaining = sum(e.getAvailableTickets() for e in events if monthStart <= e.getEventDate() <= monthEnd)
+    loopRatios = [e.getSoldTickets() / e.getTotalCapacity() for e in events]
+    loopTime = time.perf_counter() - start
+
+    start = time.perf_counter()
+    rows = catalog.rowsWithAvailability(5000)
+    remaining = catalog.totalRemainingCapacity(monthStart, monthEnd)
+    ratios = catalog.sellThroughRatios()
+    vectorTime = time.perf_counter() - start
+
+    assert len(rows) == len(loopAvailable) and remaining == loopRemaining
+    assert np.allclose(ratios, loopRatios)
+    print(f"{len(rows)} events with >5000 seats left, {remaining} seats left in November 2025")
+    print(f"Python loop: {loopTime * 1000:.1f} ms | Vectorized: {vectorTime * 1000:.2f} ms")
+
+    # Views behave like normal Event objects
+    view = catalog.getEventByID(42)
+    view.updateSoldTickets(1)
+    print("Event view:", view.getEventDetails())
@@ -0,0 +1,66 @@
+from bisect import bisect_left, bisect_right
+from datetime import date
+
+# EventDateIndex class keeping events ordered by date for range and "next N" queries
+# Dates and events are held in two aligned lists so lookups are a bisect over the dates
+class EventDateIndex:
+    def __init__(self, events=()):
+        pairs = sorted(((event.getEventDate(), i, event) for i, event in enumerate(events)),
+                       key=lambda pair: (pair[0], pair[1]))
+        self.__dates = [eventDate for eventDate, _, _ in pairs]
+        self.__events = [event for _, _, event in pairs]
+
+    # Inserts an event after any events already on the same date
+    def add(self, event):
+        position = bisect_right(self.__dates, event.getEventDate())
+        self.__dates.insert(position, event.getEventDate())
+        self.__events.insert(position, event)
+
+    # Removes an event; pass oldDate if the event's date changed since it was added
+    def remove(self, event, oldDate=None):
+        eventDate = oldDate if oldDate is not None else event.getEventDate()
+        for position in range(bisect_left(self.__dates, eventDate), bisect_right(self.__dates, eventDate)):
+            if self.__events[position] is event:
+                del self.__dates[position]
+                del self.__events[position]
+                return True
+        return False
+
+    # Moves an event after its date has been changed
+    def update(self, event, oldDate):
+        if self.remove(event, oldDate):
+            self.add(event)
+
+    # Events dated from start to end inclusive, in date order (None leaves that side open)
+    def between(self, start=None, end=None):
+        low = 0 if start is None else bisect_left(self.__dates, start)
+        high = len(self.__dates) if end is None else bisect_right(self.__dates, end)
+        return self.__events[low:high]
+
+    # The next count events on or after fromDate (today by default)
+    def upcoming(self, count, fromDate=None):
+        low = bisect_left(self.__dates, fromDate if fromDate is not None else date.today())
+        return self.__events[low:low + count]
+
+    def __len__(self):
+        return len(self.__events)
+
+
+# Example: index the saved events and run a few date queries
+if __name__ == "__main__":
+    from datetime import timedelta
+    from Event import Event
+
+    start = date(2025, 11, 1)
+    events = [Event(400 + i, f"Race Day {i}", start + timedelta(days=(i * 7) % 60), "Yas Marina", 1000)
+              for i in range(12)]
+    index = EventDateIndex(events)
+    index.add(Event(500, "Season Finale", date(2025, 12, 7), "Yas Marina", 60000))
+
+    print("Events between 2025-11-10 and 2025-11-20:")
+    for event in index.between(date(2025, 11, 10), date(2025, 11, 20)):
+        print(f"- {event.getEventDate()} {event.getEventName()}")
+
+    print("\nNext 3 events from 2025-12-01:")
+    for event in index.upcoming(3, date(2025, 12, 1)):
+        print(f"- {event.getEventDate()} {event.getEventName()}")
@@ -0,0 +1,142 @@
+from bisect import bisect_left, insort
+
+# EventSearchIndex class to answer substring and prefix queries over event names and locations
+# Each field keeps a trigram inverted index (trigram -> event positions) plus a sorted list for prefixes
+class EventSearchIndex:
+    GRAM_SIZE = 3
+    FIELDS = {
+        "name": lambda event: event.getEventName(),
+        "location": lambda event: event.getLocation()
+    }
+
+    def __init__(self, events=()):
+        self.__events = []          # Indexed events by position (None once removed)
+        self.__positions = {}       # event -> position
+        self.__texts = {field: [] for field in self.FIELDS}     # Lowercased text by position
+        self.__grams = {field: {} for field in self.FIELDS}     # trigram -> set of positions
+        self.__sorted = {field: [] for field in self.FIELDS}    # Sorted (text, position) pairs
+        for event in events:
+            self.add(event)
+
+    # Splits lowercased text into its overlapping trigrams
+    @classmethod
+    def toGrams(cls, text):
+        return {text[i:i + cls.GRAM_SIZE] for i in range(len(text) - cls.GRAM_SIZE + 1)}
+
+    # Adds an event to every field index
+    def add(self, event):
+        if event in self.__positions:
+            return False
+        position = len(self.__events)
+        self.__events.append(event)
+        self.__positions[event] = position
+        for field, getText in self.FIELDS.items():
+            text = getText(event).lower()
+            self.__texts[field].append(text)
+            for gram in self.toGrams(text):
+                self.__grams[field].setdefault(gram, set()).add(position)
+            insort(self.__sorted[field], (text, position))
+        return True
+
+    # Removes an event from every field index
+    def remove(self, event):
+        position = self.__positions.pop(event, None)
+        if position is None:
+            return False
+        for field in self.FIELDS:
+            text = self.__texts[field][position]
+            for gram in self.toGrams(text):
+                postings = self.__grams[field][gram]
+                postings.discard(position)
+                if not postings:
+                    del self.__grams[field][gram]
+            sortedTexts = self.__sorted[field]
+            del sortedTexts[bisect_left(sortedTexts, (text, position))]
+            self.__texts[field][position] = None
+        self.__events[position] = None
+        return True
+
+    # Re-indexes an event after its name or location has changed
+    def update(self, event):
+        self.remove(event)
+        self.add(event)
+
+    # Returns events whose field contains the query (case-insensitive), in insertion order
+    def search(self, field, query):
+        query = query.lower()
+        texts = self.__texts[field]
+        if len(query) < self.GRAM_SIZE:
+            # Too short for a trigram lookup, scan the prepared lowercase texts instead
+            positions = [p for p, text in enumerate(texts) if text is not None and query in text]
+        else:
+            postings = []
+            for gram in self.toGrams(query):
+                posting = self.__grams[field].get(gram)
+                if not posting:
+                    return []
+                postings.append(posting)
+            postings.sort(key=len)
+            candidates = set(postings[0])
+            for posting in postings[1:]:
+                candidates &= posting
+                if not candidates:
+                    return []
+            # Trigram matches can be out of order, so confirm the full substring
+            positions = sorted(p for p in candidates if query in texts[p])
+        return [self.__events[p] for p in positions]
+
+    # Returns events whose field starts with the prefix (case-insensitive), in alphabetical order
+    def searchPrefix(self, field, prefix):
+        prefix = prefix.lower()
+        sortedTexts = self.__sorted[field]
+        results = []
+        for i in range(bisect_left(sortedTexts, (prefix, -1)), len(sortedTexts)):
+            text, position = sortedTexts[i]
+            if not text.startswith(prefix):
+                break
+            results.append(self.__events[position])
+        return results
+
+    def __len__(self):
+        return len(self.__positions)
+
+    def __contains__(self, event):
+        return event in self.__positions
+
+
+# Benchmark comparing the index with the linear scan used by TicketingSystem.searchEvents
+if __name__ == "__main__":
+    import random
+    import time
+    from datetime import date, timedelta
+    from Event import Event
+
+    random.seed(7)
+    circuits = ["Yas Marina", "Silverstone", "Monza", "Suzuka", "Interlagos", "Spa", "Monaco", "Bahrain"]
+    kinds = ["Grand Prix", "Qualifiers", "Practice Session", "Sprint Race", "Fan Zone", "Paddock Tour"]
+    events = []
+    for i in range(50000):
+        circuit = random.choice(circuits)
+        name = f"{circuit} {random.choice(kinds)} {2025 + i % 5} #{i}"
+        events.append(Event(i, name, date(2025, 1, 1) + timedelta(days=i % 1500), circuit, 5000, 0))
+
+    start = time.perf_counter()
+    index = EventSearchIndex(events)
+    print(f"Indexed {len(index)} events in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    def linearScan(query):
+        return [e for e in events if query.lower() in e.getEventDetails()["Event Name"].lower()]
+
+    for query in ["Monza Sprint Race 2027", "#4242", "Paddock", "spa fan zone"]:
+        start = time.perf_counter()
+        expected = linearScan(query)
+        linearTime = time.perf_counter() - start
+        start = time.perf_counter()
+        found = index.search("name", query)
+        indexTime = time.perf_counter() - start
+        assert found == expected
+        print(f"'{query}': {len(found)} matches | linear {linearTime * 1000:.2f} ms | index {indexTime * 1000:.3f} ms")
+
+    start = time.perf_counter()
+    found = index.searchPrefix("name", "Suzuka Grand Prix 2026 #12")
+    print(f"Prefix 'Suzuka Grand Prix 2026 #12': {len(found)} matches in {(time.perf_counter() - start) * 1000:.3f} ms")
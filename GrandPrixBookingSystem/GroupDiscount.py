@@ -1,3 +1,6 @@
+from bisect import bisect_right
+import numpy as np
+
 # GroupDiscount class to calculate group-based discounts
 
 class GroupDiscount:
@@ -25,7 +28,10 @@ class GroupDiscount:
         return self.__discountPercentage
 
     # Method to calculate the discounted price for a given base price
-    def calculateDiscount(self, basePrice):
+    # If partySize is given, parties smaller than the group size pay the base price
+    def calculateDiscount(self, basePrice, partySize=None):
+        if partySize is not None and partySize < self.getGroupSize():
+            return basePrice
         discount = basePrice * (self.getDiscountPercentage() / 100)
         return basePrice - discount
 
@@ -33,6 +39,56 @@ class GroupDiscount:
     def __str__(self):
         return f"Group size: {self.__groupSize}, Discount: {self.__discountPercentage}%"
 
+
+# GroupDiscountSchedule class holding discount tiers by minimum party size (e.g. 5+ = 10%, 8+ = 15%)
+# A party gets the tier with the largest group size it reaches, found by bisecting the thresholds
+class GroupDiscountSchedule:
+    def __init__(self, tiers=()):
+        self.__sizes = []       # Tier group sizes, ascending
+        self.__tiers = []       # GroupDiscount for each size
+        for tier in tiers:
+            self.addTier(tier)
+
+    # Adds a tier, replacing any tier with the same group size
+    def addTier(self, groupDiscount):
+        self.removeTier(groupDiscount.getGroupSize())
+        position = bisect_right(self.__sizes, groupDiscount.getGroupSize())
+        self.__sizes.insert(position, groupDiscount.getGroupSize())
+        self.__tiers.insert(position, groupDiscount)
+
+    # Removes the tier for a group size; returns False if there is none
+    def removeTier(self, groupSize):
+        position = bisect_right(self.__sizes, groupSize) - 1
+        if position < 0 or self.__sizes[position] != groupSize:
+            return False
+        del self.__sizes[position]
+        del self.__tiers[position]
+        return True
+
+    def getTiers(self):
+        return list(self.__tiers)
+
+    # Returns the GroupDiscount a party of partySize qualifies for, or None
+    def getTier(self, partySize):
+        position = bisect_right(self.__sizes, partySize) - 1
+        return self.__tiers[position] if position >= 0 else None
+
+    def getDiscountPercentage(self, partySize):
+        tier = self.getTier(partySize)
+        return tier.getDiscountPercentage() if tier else 0
+
+    # Discounted price per ticket for party sizes and base prices
+    # Accepts single values or arrays of equal length; arrays are priced in one vectorized pass
+    def calculateDiscount(self, partySizes, basePrices):
+        positions = np.searchsorted(np.asarray(self.__sizes, dtype=np.int64), partySizes, side='right')
+        percentages = np.array([0.0] + [tier.getDiscountPercentage() for tier in self.__tiers])[positions]
+        basePrices = np.asarray(basePrices, dtype=np.float64)
+        discounted = basePrices - basePrices * (percentages / 100)
+        return float(discounted) if discounted.ndim == 0 else discounted
+
+    def __str__(self):
+        return ", ".join(f"{size}+ = {tier.getDiscountPercentage()}%" for size, tier in zip(self.__sizes, self.__tiers))
+
 # Test Code for GroupDiscount
 if __name__ == "__main__":
     print("Test GroupDiscount Class\n")
@@ -65,3 +121,33 @@ if __name__ == "__main__":
     print("Discount Percentage:", ghazlan_discount.getDiscountPercentage(), "%")
     print("Original Price:", base_price, "AED")
     print("Discounted Price:", ghazlan_discounted_price, "AED")
+
+    # Tiered schedule: the party size picks the tier
+    schedule = GroupDiscountSchedule([salama_discount, ghazlan_discount])
+    print("\nGroup discount schedule:", schedule)
+    for party_size in (3, 5, 7, 8, 12):
+        print(f"Party of {party_size}: {schedule.calculateDiscount(party_size, base_price)} AED per ticket")
+
+    # Batch quote for corporate bookings: vectorized versus one lookup per party
+    import random
+    import time
+
+    random.seed(20)
+    schedule.addTier(GroupDiscount(groupSize=20, discountPercentage=20.0))
+    schedule.addTier(GroupDiscount(groupSize=50, discountPercentage=25.0))
+    party_sizes = [random.randint(1, 80) for _ in range(100000)]
+    base_prices = [random.choice([150.0, 300.0, 950.0]) for _ in range(100000)]
+
+    start = time.perf_counter()
+    expected = []
+    for party_size, price in zip(party_sizes, base_prices):
+        tier = schedule.getTier(party_size)
+        expected.append(tier.calculateDiscount(price) if tier else price)
+    loop_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    quotes = schedule.calculateDiscount(np.array(party_sizes), np.array(base_prices))
+    vector_time = time.perf_counter() - start
+
+    assert quotes.tolist() == expected
+    print(f"\n100000 party quotes: per-party loop {loop_time * 1000:.0f} ms | vectorized {vector_time * 1000:.1f} ms")
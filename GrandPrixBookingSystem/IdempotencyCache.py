@@ -0,0 +1,209 @@
+from collections import OrderedDict
+from concurrent.futures import Future
+import pickle
+import sqlite3
+import threading
+import time
+
+IDEMPOTENCY_DB = 'idempotency.db'  # Results of recent payment requests, shared by every process
+_LOOK_AGAIN = object()  # Tells waiting threads the key was running in another process
+
+
+# IdempotencyCache class making retried payment requests return the first attempt's outcome
+# Results are keyed by a caller-supplied idempotency key (for example the order or request ID).
+# Recent results sit in an in-memory LRU, backed by an SQLite table so other processes and
+# restarts see them too. A request already running under the same key is waited on instead of
+# being sent to the gateway again. Entries older than maxAge seconds are evicted.
+class IdempotencyCache:
+    def __init__(self, filename=IDEMPOTENCY_DB, capacity=10000, maxAge=24 * 3600, claimTimeout=60.0,
+                 evictEvery=1000, clock=time.time):
+        self.__connection = sqlite3.connect(filename, timeout=30, isolation_level=None, check_same_thread=False)
+        # result is NULL while the request is still running (claimed by some process)
+        self.__connection.execute("CREATE TABLE IF NOT EXISTS idempotency (key TEXT PRIMARY KEY, result BLOB, "
+                                  "created_at REAL NOT NULL)")
+        self.__connection.execute("CREATE INDEX IF NOT EXISTS idempotency_age ON idempotency (created_at)")
+        self.__dbLock = threading.Lock()
+        self.__lock = threading.Lock()
+        self.__recent = OrderedDict()  # key -> (result, createdAt), least recently used first
+        self.__running = {}            # key -> Future for requests running in this process
+        self.__capacity = capacity
+        self.__maxAge = maxAge
+        self.__claimTimeout = claimTimeout  # Seconds before another process's unfinished claim is taken over
+        self.__evictEvery = evictEvery
+        self.__writes = 0
+        self.__clock = clock
+
+    # Returns (True, result) for a finished request, otherwise (False, None)
+    def get(self, key):
+        now = self.__clock()
+        with self.__lock:
+            entry = self.__recent.get(key)
+            if entry is not None:
+                if now - entry[1] <= self.__maxAge:
+                    self.__recent.move_to_end(key)
+                    return True, entry[0]
+                del self.__recent[key]
+        with self.__dbLock:
+            row = self.__connection.execute("SELECT result, created_at FROM idempotency WHERE key = ? "
+                                            "AND result IS NOT NULL", (key,)).fetchone()
+        if row is None or now - row[1] > self.__maxAge:
+            return False, None
+        result = pickle.loads(row[0])
+        self.__remember(key, result, row[1])
+        return True, result
+
+    def __remember(self, key, result, createdAt):
+        with self.__lock:
+            self.__recent[key] = (result, createdAt)
+            self.__recent.move_to_end(key)
+            if len(self.__recent) > self.__capacity:
+                self.__recent.popitem(last=False)
+
+    # Stores the outcome of a finished request
+    def put(self, key, result):
+        createdAt = self.__clock()
+        with self.__dbLock:
+            self.__connection.execute("INSERT OR REPLACE INTO idempotency VALUES (?, ?, ?)",
+                                      (key, pickle.dumps(result), createdAt))
+        self.__remember(key, result, createdAt)
+        self.__writes += 1
+        if self.__writes % self.__evictEvery == 0:
+            self.evictExpired()
+
+    # Claims a key in the table; returns False if another process is already running it
+    # A claim left unfinished for claimTimeout seconds (its process died) can be taken over
+    def claim(self, key):
+        now = self.__clock()
+        with self.__dbLock:
+            connection = self.__connection
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                row = connection.execute("SELECT result, created_at FROM idempotency WHERE key = ?", (key,)).fetchone()
+                expired = row is not None and (now - row[1] > self.__maxAge if row[0] is not None
+                                               else now - row[1] > self.__claimTimeout)
+                claimed = row is None or expired
+                if claimed:
+                    connection.execute("INSERT OR REPLACE INTO idempotency VALUES (?, NULL, ?)", (key, now))
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+        return claimed
+
+    # Releases a claim without storing a result, so the next attempt under the key runs again
+    def release(self, key):
+        with self.__dbLock:
+            self.__connection.execute("DELETE FROM idempotency WHERE key = ? AND result IS NULL", (key,))
+
+    # Runs action() once per key and returns its result; retries with the same key get that result
+    # If action raises, the key is released so a later retry can try again
+    def run(self, key, action):
+        while True:
+            found, result = self.get(key)
+            if found:
+                return result
+            with self.__lock:
+                future = self.__running.get(key)
+                owner = future is None
+                if owner:
+                    future = self.__running[key] = Future()
+            if not owner:  # Same key already running in this process
+                result = future.result()
+                if result is _LOOK_AGAIN:
+                    continue
+                return result
+            try:
+                if self.claim(key):
+                    break
+            except BaseException as error:
+                self.__finishRunning(key, future, error=error)
+                raise
+            # Another process is running it: wait for its result, then look again
+            self.__finishRunning(key, future, retry=True)
+            time.sleep(0.05)
+        try:
+            result = action()
+        except BaseException as error:
+            self.release(key)
+            self.__finishRunning(key, future, error=error)
+            raise
+        self.put(key, result)
+        self.__finishRunning(key, future, result=result)
+        return result
+
+    def __finishRunning(self, key, future, result=None, error=None, retry=False):
+        with self.__lock:
+            self.__running.pop(key, None)
+        if retry:
+            future.set_result(_LOOK_AGAIN)
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    # Processes a payment once per key; a retry gets the original message and payment status
+    def processPayment(self, payment, key):
+        message, status = self.run(key, lambda: (payment.processPayment(), payment.getPaymentStatus()))
+        payment.setPaymentStatus(status)
+        return message
+
+    # Deletes results older than maxAge (and abandoned claims); returns how many rows were removed
+    def evictExpired(self):
+        now = self.__clock()
+        with self.__lock:
+            for key in [key for key, (_, createdAt) in self.__recent.items() if now - createdAt > self.__maxAge]:
+                del self.__recent[key]
+        with self.__dbLock:
+            cursor = self.__connection.execute("DELETE FROM idempotency WHERE (result IS NOT NULL AND created_at < ?) "
+                                               "OR (result IS NULL AND created_at < ?)",
+                                               (now - self.__maxAge, now - self.__claimTimeout))
+        return cursor.rowcount
+
+    def close(self):
+        self.__connection.close()
+
+
+# Retry storm: many threads resend the same payments while the gateway is slow
+if __name__ == "__main__":
+    import os
+    import tempfile
+    from datetime import date
+    from Payment import Payment
+
+    charges = {}
+    chargesLock = threading.Lock()
+
+    # Payment whose processing takes a slow gateway round trip and counts the charges made
+    class SlowGatewayPayment(Payment):
+        def processPayment(self):
+            time.sleep(0.05)
+            with chargesLock:
+                charges[self.getPaymentID()] = charges.get(self.getPaymentID(), 0) + 1
+            return super().processPayment()
+
+    cache = IdempotencyCache(os.path.join(tempfile.mkdtemp(), IDEMPOTENCY_DB))
+    orderIDs = list(range(7001, 7021))
+
+    def client(seed):
+        for orderID in orderIDs[seed % 5:] + orderIDs[:seed % 5]:
+            payment = SlowGatewayPayment(orderID, 250.0, date(2025, 5, 10))  # Each retry is a fresh request
+            cache.processPayment(payment, f"order-{orderID}")
+            assert payment.getPaymentStatus() == Payment.STATUS_PROCESSED
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=client, args=(seed,)) for seed in range(50)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    assert charges == {orderID: 1 for orderID in orderIDs}, charges
+    print(f"\n50 clients x {len(orderIDs)} payments ({50 * len(orderIDs)} requests) in {elapsed:.2f} s: "
+          f"{sum(charges.values())} charges sent to the gateway")
+
+    start = time.perf_counter()
+    for _ in range(100000):
+        cache.get("order-7005")
+    print(f"Cached lookup: {(time.perf_counter() - start) / 100000 * 1e6:.2f} us")
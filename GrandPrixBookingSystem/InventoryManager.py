@@ -0,0 +1,110 @@
+import threading
+
+# InventoryManager class to make ticket reservations atomic per event
+# Events are spread over a fixed pool of lock stripes by event ID, so bookings for
+# the same event are serialized while unrelated events rarely share a lock
+class InventoryManager:
+    DEFAULT_STRIPES = 64
+
+    def __init__(self, stripes=DEFAULT_STRIPES):
+        self.__locks = [threading.Lock() for _ in range(stripes)]
+
+    # Returns the lock guarding an event's sold ticket count
+    def getLock(self, event):
+        return self.__locks[hash(event.getEventID()) % len(self.__locks)]
+
+    # Checks availability and sells the tickets in one step; returns False if not enough are left
+    def reserve(self, event, count=1):
+        with self.getLock(event):
+            if event.getAvailableTickets() < count:
+                return False
+            event.updateSoldTickets(count)
+            return True
+
+    # Reserves tickets across several events all-or-nothing; requests are (event, count) pairs
+    def reserveMany(self, requests):
+        totals = {}
+        for event, count in requests:
+            totals[event] = totals.get(event, 0) + count
+        # Take each stripe once, in a fixed order, so concurrent carts cannot deadlock
+        stripes = sorted({hash(event.getEventID()) % len(self.__locks) for event in totals})
+        for stripe in stripes:
+            self.__locks[stripe].acquire()
+        try:
+            if any(event.getAvailableTickets() < count for event, count in totals.items()):
+                return False
+            for event, count in totals.items():
+                event.updateSoldTickets(count)
+            return True
+        finally:
+            for stripe in reversed(stripes):
+                self.__locks[stripe].release()
+
+    # Gives back tickets from a cancelled or failed booking
+    def release(self, event, count=1):
+        with self.getLock(event):
+            event.updateSoldTickets(-count)
+
+
+# Stress test: many threads booking a handful of events must never oversell
+if __name__ == "__main__":
+    import sys
+    from datetime import date
+    from TicketingSystem import TicketingSystem, Event
+
+    sys.setswitchinterval(1e-6)  # Switch threads as often as possible to expose races
+
+    system = TicketingSystem()
+    customer = system.registerCustomer({"username": "stress", "password": "x", "email": "stress@example.com"})
+    capacities = [50, 200, 1000, 1]
+    for eventID, capacity in enumerate(capacities, start=1):
+        system.addEvent(Event(eventID, f"Stress Event {eventID}", date(2025, 12, 1), "Yas Marina", capacity, 0))
+
+    threadCount = 32
+    attemptsPerThread = 100
+    booked = [0] * threadCount
+
+    def worker(index):
+        for attempt in range(attemptsPerThread):
+            event = system.events[(index + attempt) % len(system.events)]
+            if system.bookTicket(event, "Standard", customer):
+                booked[index] += 1
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(threadCount)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for event in system.events:
+        assert event.getSoldTickets() <= event.getTotalCapacity(), "Event oversold!"
+        print(f"{event.getEventName()}: sold {event.getSoldTickets()}/{event.getTotalCapacity()}")
+    assert sum(booked) == len(system.orders) == sum(e.getSoldTickets() for e in system.events)
+    print(f"{sum(booked)} bookings from {threadCount * attemptsPerThread} attempts, no overselling")
+
+    # Group and cart bookings racing on overlapping events must stay all-or-nothing
+    system = TicketingSystem()
+    customer = system.registerCustomer({"username": "group", "password": "x", "email": "group@example.com"})
+    for eventID in range(1, 5):
+        system.addEvent(Event(eventID, f"Group Event {eventID}", date(2025, 12, 1), "Yas Marina", 97, 0))
+
+    def groupWorker(index):
+        for attempt in range(50):
+            first = system.events[(index + attempt) % 4]
+            second = system.events[(index + attempt + 1) % 4]
+            if attempt % 2:
+                system.bookTickets(first, "Standard", customer, 3)
+            else:
+                system.bookCart(customer, [(first, "VIP", 2), (second, "Standard", 5)])
+
+    threads = [threading.Thread(target=groupWorker, args=(i,)) for i in range(threadCount)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for event in system.events:
+        assert event.getSoldTickets() <= event.getTotalCapacity(), "Event oversold!"
+        print(f"{event.getEventName()}: sold {event.getSoldTickets()}/{event.getTotalCapacity()}")
+    assert len(system.orders) == sum(e.getSoldTickets() for e in system.events)
+    print(f"{len(system.orders)} tickets booked in groups and carts, no overselling")
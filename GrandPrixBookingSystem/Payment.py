@@ -69,15 +69,16 @@ class Payment:
             "Payment Status": self.getPaymentStatus()
         }
 
-# Test case for Salama Alneyadi
-salama_payment = Payment(1001, 750.0, date(2025, 5, 10))
-print("Salama Alneyadi's Payment")
-print(salama_payment.processPayment())  # Processing the payment
-print(salama_payment.getPaymentDetails())  # Display payment details
+if __name__ == "__main__":
+    # Test case for Salama Alneyadi
+    salama_payment = Payment(1001, 750.0, date(2025, 5, 10))
+    print("Salama Alneyadi's Payment")
+    print(salama_payment.processPayment())  # Processing the payment
+    print(salama_payment.getPaymentDetails())  # Display payment details
 
-# Test case for Ghazlan Alketbi
-ghazlan_payment = Payment(1002, 400.0, date(2025, 5, 10))
-print("\nGhazlan Alketbi's Payment")
-print(ghazlan_payment.processPayment())  # Processing the payment
-print(ghazlan_payment.refundPayment())  # Refunding the payment
-print(ghazlan_payment.getPaymentDetails())  # Display payment details
+    # Test case for Ghazlan Alketbi
+    ghazlan_payment = Payment(1002, 400.0, date(2025, 5, 10))
+    print("\nGhazlan Alketbi's Payment")
+    print(ghazlan_payment.processPayment())  # Processing the payment
+    print(ghazlan_payment.refundPayment())  # Refunding the payment
+    print(ghazlan_payment.getPaymentDetails())  # Display payment details
@@ -0,0 +1,59 @@
+from datetime import date
+import random
+import threading
+import time
+
+
+# Raised by a gateway when a whole batch could not be sent (timeout, connection reset, ...)
+# Every payment in the batch can be retried
+class GatewayError(Exception):
+    pass
+
+
+# PaymentGateway class defining what SettlementPipeline needs from a payment provider
+# settleBatch sends several payments in one round trip and returns one result per payment
+class PaymentGateway:
+    SETTLED = "Settled"            # Money captured
+    DECLINED = "Declined"          # Refused for good (invalid card, ...); not retried
+    TEMPORARY_FAILURE = "Retry"    # Provider busy or flaky; worth another attempt
+
+    def settleBatch(self, payments):
+        raise NotImplementedError("Gateways must implement settleBatch")
+
+
+# LocalGateway class standing in for a real provider in development and load tests
+# Each batch costs one simulated round trip; failures are drawn at the configured rates
+class LocalGateway(PaymentGateway):
+    def __init__(self, latency=0.02, failureRate=0.0, batchFailureRate=0.0, declineRate=0.0, seed=None):
+        self.__latency = latency                    # Seconds per round trip
+        self.__failureRate = failureRate            # Chance a single payment needs a retry
+        self.__batchFailureRate = batchFailureRate  # Chance a whole round trip fails
+        self.__declineRate = declineRate            # Chance a valid payment is refused anyway
+        self.__random = random.Random(seed)
+        self.__lock = threading.Lock()              # random.Random is shared by worker threads
+        self.__roundTrips = 0
+
+    def getRoundTrips(self):
+        return self.__roundTrips
+
+    def settleBatch(self, payments):
+        with self.__lock:
+            self.__roundTrips += 1
+            batchFails = self.__random.random() < self.__batchFailureRate
+            draws = [self.__random.random() for _ in payments]
+        time.sleep(self.__latency)
+        if batchFails:
+            raise GatewayError("Simulated gateway timeout")
+        results = []
+        today = date.today()  # One clock reading for the whole batch
+        for payment, draw in zip(payments, draws):
+            validate = getattr(payment, "validateCard", None)  # Card payments are checked like processPayment does
+            if validate is not None and not validate(today):
+                results.append(self.DECLINED)
+            elif draw < self.__failureRate:
+                results.append(self.TEMPORARY_FAILURE)
+            elif draw < self.__failureRate + self.__declineRate:
+                results.append(self.DECLINED)
+            else:
+                results.append(self.SETTLED)
+        return results
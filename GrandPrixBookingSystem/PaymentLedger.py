@@ -0,0 +1,240 @@
+import mmap
+import os
+import struct
+import threading
+import time
+import zlib
+import numpy as np
+
+LEDGER_FILE = 'payments.ledger'
+
+
+# PaymentLedger class recording every payment status change in an append-only file
+# Each transition is one fixed-size little-endian record:
+#   seq, paymentID, orderID (int64), amount, timestamp (float64), status (uint8), 3 pad bytes, crc32 (uint32)
+# Because records never move or change, the file is read through mmap as a NumPy structured array
+# without parsing, and a record cut short by a crash is simply dropped when the ledger is opened.
+class PaymentLedger:
+    RECORD = struct.Struct("<qqqddB3xI")
+    RECORD_DTYPE = np.dtype([("seq", "<i8"), ("paymentID", "<i8"), ("orderID", "<i8"), ("amount", "<f8"),
+                             ("timestamp", "<f8"), ("status", "u1"), ("pad", "V3"), ("crc", "<u4")])
+
+    PENDING, PROCESSED, REFUNDED, FAILED = range(4)
+    STATUS_NAMES = ("Pending", "Processed", "Refunded", "Failed")
+    # Allowed transitions from each status; None is a payment the ledger has not seen yet
+    TRANSITIONS = {None: {PENDING, PROCESSED, FAILED}, PENDING: {PROCESSED, FAILED}, PROCESSED: {REFUNDED},
+                   REFUNDED: set(), FAILED: set()}
+
+    def __init__(self, filename=LEDGER_FILE, sync=False, clock=time.time):
+        self.__filename = filename
+        self.__sync = sync  # fsync after every append when True
+        self.__clock = clock
+        self.__lock = threading.Lock()
+        self.__dropTornTail()
+        records = self.records()
+        self.__lastSeq = int(records["seq"][-1]) if len(records) else 0
+        # Latest status per payment; later records overwrite earlier ones
+        self.__statuses = dict(zip(records["paymentID"].tolist(), records["status"].tolist()))
+        del records
+        self.__file = open(filename, 'ab')
+
+    # Cuts off a partial last record, and the last record if its checksum is wrong
+    def __dropTornTail(self):
+        if not os.path.exists(self.__filename):
+            return
+        size = os.path.getsize(self.__filename)
+        keep = size - size % self.RECORD.size
+        if keep:
+            with open(self.__filename, 'rb') as file:
+                file.seek(keep - self.RECORD.size)
+                last = file.read(self.RECORD.size)
+            if zlib.crc32(last[:-4]) != self.RECORD.unpack(last)[-1]:
+                keep -= self.RECORD.size
+        if keep != size:
+            with open(self.__filename, 'r+b') as file:
+                file.truncate(keep)
+
+    @classmethod
+    def statusCode(cls, status):
+        return status if isinstance(status, int) else cls.STATUS_NAMES.index(status)
+
+    # Latest status name of a payment, or None if it has no records
+    def getStatus(self, paymentID):
+        code = self.__statuses.get(paymentID)
+        return None if code is None else self.STATUS_NAMES[code]
+
+    def __pack(self, seq, paymentID, orderID, amount, timestamp, status):
+        body = self.RECORD.pack(seq, paymentID, orderID, amount, timestamp, status, 0)[:-4]
+        return body + struct.pack("<I", zlib.crc32(body))
+
+    # Appends transitions given as (paymentID, orderID, amount, status) in one write
+    # Raises ValueError (and writes nothing) if any transition is not allowed
+    def appendMany(self, transitions):
+        with self.__lock:
+            now = self.__clock()
+            statuses = {}
+            chunks = []
+            seq = self.__lastSeq
+            for paymentID, orderID, amount, status in transitions:
+                code = self.statusCode(status)
+                current = statuses.get(paymentID, self.__statuses.get(paymentID))
+                if code not in self.TRANSITIONS[current]:
+                    raise ValueError(f"Payment {paymentID} cannot go from "
+                                     f"{self.STATUS_NAMES[current] if current is not None else 'new'} "
+                                     f"to {self.STATUS_NAMES[code]}")
+                statuses[paymentID] = code
+                seq += 1
+                chunks.append(self.__pack(seq, paymentID, orderID, amount, now, code))
+            self.__file.write(b"".join(chunks))
+            self.__file.flush()
+            if self.__sync:
+                os.fsync(self.__file.fileno())
+            self.__lastSeq = seq
+            self.__statuses.update(statuses)
+            return seq
+
+    # Appends one transition; returns its sequence number
+    def append(self, paymentID, orderID, amount, status):
+        return self.appendMany([(paymentID, orderID, amount, status)])
+
+    # Records a payment object's current status (any of the Payment classes) against an order
+    def recordPayment(self, payment, orderID):
+        return self.append(payment.getPaymentID(), orderID, payment.getAmount(), payment.getPaymentStatus())
+
+    # Every record as a read-only structured array backed by an mmap of the file
+    def records(self):
+        if not os.path.exists(self.__filename):
+            return np.zeros(0, dtype=self.RECORD_DTYPE)
+        with open(self.__filename, 'rb') as file:
+            size = os.fstat(file.fileno()).st_size
+            count = size // self.RECORD.size
+            if count == 0:
+                return np.zeros(0, dtype=self.RECORD_DTYPE)
+            mapped = mmap.mmap(file.fileno(), count * self.RECORD.size, access=mmap.ACCESS_READ)
+        return np.frombuffer(mapped, dtype=self.RECORD_DTYPE, count=count)
+
+    # Checks every record's checksum; returns the sequence numbers of damaged records
+    def verify(self):
+        records = self.records()
+        raw = records.view(np.uint8).reshape(len(records), self.RECORD.size)
+        return [int(record["seq"]) for record, row in zip(records, raw)
+                if zlib.crc32(row[:-4].tobytes()) != int(record["crc"])]
+
+    # Final state of every payment, sorted by (orderID, paymentID): arrays of
+    # paymentID, orderID, amount and status code
+    def finalStates(self):
+        records = self.records()
+        order = np.argsort(records["paymentID"], kind="stable")  # Stable: file (seq) order within a payment
+        payments = records["paymentID"][order]
+        last = order[np.append(payments[1:] != payments[:-1], True)] if len(order) else order
+        final = records[last]
+        byOrder = np.lexsort((final["paymentID"], final["orderID"]))
+        final = final[byOrder]
+        return final["paymentID"], final["orderID"], final["amount"], final["status"]
+
+    # Streaming merge-join of the ledger against orders given as (orderID, expectedAmount), sorted by orderID
+    # Yields (orderID, expectedAmount, settledAmount, problem) for every mismatch, where settledAmount is
+    # the total of the order's payments that ended Processed, and problem is one of
+    # "unpaid", "amount mismatch" or "no order" (Processed money for an order not in the list)
+    def reconcile(self, orders, tolerance=0.005):
+        _, orderIDs, amounts, statuses = self.finalStates()
+        settled = statuses == self.PROCESSED
+        orderIDs, amounts = orderIDs[settled], amounts[settled]
+        if len(orderIDs):  # One total per order
+            starts = np.flatnonzero(np.append(True, orderIDs[1:] != orderIDs[:-1]))
+            paidOrders = orderIDs[starts].tolist()
+            paidTotals = np.add.reduceat(amounts, starts).tolist()
+        else:
+            paidOrders, paidTotals = [], []
+
+        position, count = 0, len(paidOrders)
+        previous = None
+        for orderID, expected in orders:
+            if previous is not None and orderID <= previous:
+                raise ValueError("Orders must be sorted by order ID without repeats")
+            previous = orderID
+            while position < count and paidOrders[position] < orderID:
+                yield paidOrders[position], None, paidTotals[position], "no order"
+                position += 1
+            if position < count and paidOrders[position] == orderID:
+                paid = paidTotals[position]
+                position += 1
+                if abs(paid - expected) > tolerance:
+                    yield orderID, expected, paid, "amount mismatch"
+            elif expected > tolerance:
+                yield orderID, expected, 0.0, "unpaid"
+        while position < count:
+            yield paidOrders[position], None, paidTotals[position], "no order"
+            position += 1
+
+    def __len__(self):
+        return self.__lastSeq
+
+    def close(self):
+        self.__file.close()
+
+
+# End-of-day reconciliation over a million payments
+if __name__ == "__main__":
+    import random
+    import tempfile
+    from datetime import date
+    from DigitalWalletPayment import DigitalWalletPayment
+
+    filename = os.path.join(tempfile.mkdtemp(), LEDGER_FILE)
+    ledger = PaymentLedger(filename)
+
+    # Wallet payments from DigitalWalletPayment.py, recorded as they change state
+    wallet = DigitalWalletPayment(2001, 150.0, date(2025, 5, 10), "wallet123456", "PayPal", paymentStatus="Pending")
+    ledger.recordPayment(wallet, orderID=1)
+    wallet.processPayment()
+    ledger.recordPayment(wallet, orderID=1)
+    print("Payment 2001:", ledger.getStatus(2001))
+    try:
+        ledger.append(2001, 1, 150.0, "Pending")
+    except ValueError as error:
+        print("Rejected:", error)
+
+    # A day of traffic: most orders paid once, some refunded, failed and retried, a few broken
+    random.seed(25)
+    count = 1000000
+    expected = {1: 150.0}  # Order paid by wallet payment 2001 above
+    start = time.perf_counter()
+    batch = []
+    paymentID = 10000
+    for orderID in range(100, 100 + count):
+        amount = float(random.choice([150, 300, 950]))
+        expected[orderID] = amount
+        paymentID += 1
+        roll = random.random()
+        if roll < 0.02:    # Failed, then paid by a second payment
+            batch += [(paymentID, orderID, amount, PaymentLedger.PENDING), (paymentID, orderID, amount, PaymentLedger.FAILED)]
+            paymentID += 1
+        elif roll < 0.03:  # Refunded: the order is no longer paid
+            batch += [(paymentID, orderID, amount, PaymentLedger.PROCESSED), (paymentID, orderID, amount, PaymentLedger.REFUNDED)]
+            continue
+        elif roll < 0.0301:  # Charged the wrong amount
+            amount += 10
+        batch += [(paymentID, orderID, amount, PaymentLedger.PENDING), (paymentID, orderID, amount, PaymentLedger.PROCESSED)]
+        if len(batch) >= 100000:
+            ledger.appendMany(batch)
+            batch = []
+    ledger.appendMany(batch + [(paymentID + 1, 99, 42.0, PaymentLedger.PROCESSED)])  # Payment for an unknown order
+    writeTime = time.perf_counter() - start
+    ledger.close()
+
+    start = time.perf_counter()
+    ledger = PaymentLedger(filename)
+    openTime = time.perf_counter() - start
+
+    start = time.perf_counter()
+    problems = list(ledger.reconcile(sorted(expected.items())))
+    reconcileTime = time.perf_counter() - start
+
+    kinds = {}
+    for problem in problems:
+        kinds[problem[3]] = kinds.get(problem[3], 0) + 1
+    print(f"\n{len(ledger)} ledger records ({os.path.getsize(filename) / 1e6:.0f} MB) written in {writeTime:.1f} s, "
+          f"reopened in {openTime:.2f} s")
+    print(f"Reconciled {count} orders in {reconcileTime:.2f} s: {kinds}")
+    print("First problems:", problems[:3])
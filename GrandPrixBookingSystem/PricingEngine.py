@@ -0,0 +1,140 @@
+import numpy as np
+
+ORDINAL_1970 = 719163  # date(1970, 1, 1).toordinal(), the NumPy datetime64 epoch
+
+# PricingEngine class pricing whole arrays of tickets in one vectorized pass
+# Each method repeats the arithmetic of the matching calculatePrice in the same order,
+# so results are identical to the per-object methods
+class PricingEngine:
+    SEAT_MULTIPLIERS = {"vip": 1.2, "premium": 1.1}  # SingleRacePass; other seats pay the base price
+    WEEKEND_PREMIUM_MULTIPLIER = 1.2                 # WeekendPackage 'premium' packages
+    WEEKEND_EXTRA_DAY_FEE = 50                       # WeekendPackage, per day beyond the first
+    SEASON_MULTIPLIERS = {"vip": 1.5}                # SeasonMembership; other levels use the default
+    SEASON_DEFAULT_MULTIPLIER = 1.2
+
+    # Maps coded labels to multipliers through their lookup table (case-insensitive)
+    @staticmethod
+    def _multipliers(codes, table, mapping, default):
+        perLabel = np.array([mapping.get(label.lower(), default) for label in table] or [default], dtype=np.float64)
+        return perLabel[codes]
+
+    # Splits an array of labels into a table of distinct labels and a code per element
+    @staticmethod
+    def _encode(labels):
+        table, codes = np.unique(np.asarray(labels, dtype=str), return_inverse=True)
+        return codes.reshape(-1), [str(label) for label in table]
+
+    # Months covered from validFrom to validUntil, counting both end months
+    @staticmethod
+    def _durationMonths(validFrom, validUntil):
+        fromMonths = np.asarray(validFrom, dtype='datetime64[D]').astype('datetime64[M]').astype(np.int64)
+        untilMonths = np.asarray(validUntil, dtype='datetime64[D]').astype('datetime64[M]').astype(np.int64)
+        return untilMonths - fromMonths + 1
+
+    # Rounds to cents like Python's round(x, 2), including the rare values where np.round differs
+    @staticmethod
+    def _roundCents(raw):
+        rounded = np.round(raw, 2)
+        scaled = raw * 100
+        nearTie = np.flatnonzero(np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6)
+        for i in nearTie:
+            rounded[i] = round(float(raw[i]), 2)
+        return rounded
+
+    # SingleRacePass.calculatePrice for arrays of base prices and seat locations
+    @classmethod
+    def singleRacePassPrices(cls, basePrices, seatLocations, table=None):
+        codes, table = (np.asarray(seatLocations), table) if table is not None else cls._encode(seatLocations)
+        return np.asarray(basePrices, dtype=np.float64) * cls._multipliers(codes, table, cls.SEAT_MULTIPLIERS, 1.0)
+
+    # WeekendPackage.calculatePrice for arrays of base prices, package types and included day counts
+    @classmethod
+    def weekendPackagePrices(cls, basePrices, packageTypes, dayCounts, table=None):
+        codes, table = (np.asarray(packageTypes), table) if table is not None else cls._encode(packageTypes)
+        premium = cls._multipliers(codes, table, {"premium": True}, False).astype(bool)
+        prices = np.array(basePrices, dtype=np.float64)
+        prices[premium] *= cls.WEEKEND_PREMIUM_MULTIPLIER
+        return prices + cls.WEEKEND_EXTRA_DAY_FEE * (np.asarray(dayCounts, dtype=np.int64) - 1)
+
+    # SeasonMembership.calculatePrice for arrays of base prices, levels and validity dates
+    @classmethod
+    def seasonMembershipPrices(cls, basePrices, membershipLevels, validFrom, validUntil, table=None):
+        codes, table = (np.asarray(membershipLevels), table) if table is not None else cls._encode(membershipLevels)
+        multipliers = cls._multipliers(codes, table, cls.SEASON_MULTIPLIERS, cls.SEASON_DEFAULT_MULTIPLIER)
+        raw = np.asarray(basePrices, dtype=np.float64) * cls._durationMonths(validFrom, validUntil) * multipliers
+        return cls._roundCents(raw)
+
+    # Prices every ticket in a TicketStore straight from its columns
+    @classmethod
+    def priceStore(cls, store):
+        from TicketStore import StoredSingleRacePass, StoredWeekendPackage, StoredSeasonMembership
+
+        def column(name, dtype):
+            values, table = store.getColumn(name)
+            return np.frombuffer(values, dtype=dtype) if len(values) else np.zeros(0, dtype=dtype), table
+
+        basePrices, _ = column("_basePrice", np.float64)
+        viewClass = store.getViewClass()
+        if issubclass(viewClass, StoredSingleRacePass):
+            codes, table = column("_seatLocation", np.uint16)
+            return cls.singleRacePassPrices(basePrices, codes, table)
+        if issubclass(viewClass, StoredWeekendPackage):
+            typeCodes, typeTable = column("packageType", np.uint16)
+            dayCodes, dayTable = column("includedDays", np.uint16)
+            dayCounts = np.array([len(days) for days in dayTable] or [0], dtype=np.int64)[dayCodes]
+            return cls.weekendPackagePrices(basePrices, typeCodes, dayCounts, typeTable)
+        if issubclass(viewClass, StoredSeasonMembership):
+            levelCodes, levelTable = column("membershipLevel", np.uint16)
+            validFrom = (column("validFrom", np.int32)[0] - ORDINAL_1970).astype('datetime64[D]')
+            validUntil = (column("validUntil", np.int32)[0] - ORDINAL_1970).astype('datetime64[D]')
+            return cls.seasonMembershipPrices(basePrices, levelCodes, validFrom, validUntil, levelTable)
+        return basePrices.copy()
+
+
+# Check against the per-object methods and time a full reprice
+if __name__ == "__main__":
+    import random
+    import time
+    from datetime import date, timedelta
+    from SingleRacePass import SingleRacePass
+    from WeekendPackage import WeekendPackage
+    from SeasonMembership import SeasonMembership
+    from TicketStore import TicketStore, StoredSingleRacePass, StoredWeekendPackage, StoredSeasonMembership
+
+    random.seed(5)
+    count = 200000
+    raceDate = date(2025, 12, 7)
+    races = [SingleRacePass(i, round(random.uniform(50, 900), 2), raceDate, "Sunday",
+                            random.choice(["VIP", "vip", "Premium", "Standard", "Grandstand"])) for i in range(count)]
+    weekends = [WeekendPackage(i, round(random.uniform(100, 1500), 2), raceDate,
+                               random.choice([["Sunday"], ["Saturday", "Sunday"], ["Friday", "Saturday", "Sunday"]]),
+                               random.choice(["Premium", "Standard"])) for i in range(count)]
+    seasons = []
+    for i in range(count):
+        validFrom = date(2025, 1, 1) + timedelta(days=random.randint(0, 300))
+        seasons.append(SeasonMembership(i, round(random.uniform(20, 400), 2), raceDate, validFrom,
+                                        validFrom + timedelta(days=random.randint(0, 400)), random.choice(["VIP", "Standard"])))
+
+    for label, tickets, viewClass in (("SingleRacePass", races, StoredSingleRacePass),
+                                      ("WeekendPackage", weekends, StoredWeekendPackage),
+                                      ("SeasonMembership", seasons, StoredSeasonMembership)):
+        start = time.perf_counter()
+        expected = [ticket.calculatePrice() for ticket in tickets]
+        loopTime = time.perf_counter() - start
+
+        store = TicketStore.fromTickets(viewClass, tickets)
+        start = time.perf_counter()
+        prices = PricingEngine.priceStore(store)
+        vectorTime = time.perf_counter() - start
+
+        assert prices.tolist() == expected, f"{label} prices differ"
+        print(f"{label}: {count} prices identical | per-object loop {loopTime * 1000:.0f} ms | vectorized {vectorTime * 1000:.1f} ms")
+
+    # Raise every single-race base price by 10% in place, then reprice the whole inventory
+    store = TicketStore.fromTickets(StoredSingleRacePass, races)
+    start = time.perf_counter()
+    basePrices = np.frombuffer(store.getColumn("_basePrice")[0], dtype=np.float64)
+    basePrices *= 1.1
+    prices = PricingEngine.priceStore(store)
+    print(f"Base price +10% and reprice of {count} tickets: {(time.perf_counter() - start) * 1000:.1f} ms")
+    print("Ticket 0 after reprice:", store.get(0).calculatePrice(), "=", prices[0])
@@ -0,0 +1,312 @@
+import itertools
+import sqlite3
+import threading
+
+REDEMPTIONS_DB = 'promo_redemptions.db'  # Shared by every checkout process
+
+
+# Slice of a promo code's redemption allowance owned by a group of threads
+class _Shard:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.remaining = 0  # Redemptions leased from the store and not yet used
+        self.used = 0       # Redemptions not yet written to the store
+
+
+# A promo code's caps and shards inside one process
+class _CodeState:
+    def __init__(self, caps, shardCount):
+        self.caps = caps  # (maxRedemptions, maxPerCustomer), re-read from the store whenever a lease is refreshed
+        self.shards = [_Shard() for _ in range(shardCount)]
+        self.leaseLock = threading.Lock()
+
+
+# PromoRedemptionManager class enforcing per-code and per-customer usage caps for discount codes
+# Caps are shared through SQLite: a process leases redemptions in batches with an atomic
+# check-and-add on the leased total, so all processes together never pass a cap.
+# Inside a process a code's leased redemptions are split over shards, and each checkout
+# thread sticks to one shard, so a hot code is not serialized on a single lock. Customer
+# allowances are small and live under striped locks like InventoryManager. Usage counts are
+# written back in batches by flush() (every flushEvery redemptions, and on close).
+class PromoRedemptionManager:
+    DEFAULT_SHARDS = 16
+    DEFAULT_STRIPES = 64
+
+    def __init__(self, filename=REDEMPTIONS_DB, leaseSize=64, flushEvery=200, shards=DEFAULT_SHARDS,
+                 stripes=DEFAULT_STRIPES):
+        self.__connection = sqlite3.connect(filename, timeout=30, isolation_level=None, check_same_thread=False)
+        self.__connection.execute("CREATE TABLE IF NOT EXISTS promo_caps (code TEXT PRIMARY KEY, "
+                                  "max_redemptions INTEGER, max_per_customer INTEGER)")
+        # customer is '' for the code-wide counter
+        self.__connection.execute("CREATE TABLE IF NOT EXISTS promo_usage (code TEXT NOT NULL, customer TEXT NOT NULL, "
+                                  "leased INTEGER NOT NULL DEFAULT 0, used INTEGER NOT NULL DEFAULT 0, "
+                                  "PRIMARY KEY (code, customer))")
+        self.__dbLock = threading.Lock()
+        self.__leaseSize = leaseSize
+        self.__flushEvery = flushEvery
+        self.__shardCount = shards
+        self.__codes = {}         # code -> _CodeState
+        self.__codesLock = threading.Lock()
+        self.__customers = {}     # (code, customer) -> [remaining, used]
+        self.__stripes = [threading.Lock() for _ in range(stripes)]
+        self.__flushLock = threading.Lock()
+        self.__pending = itertools.count()  # Thread-safe ticker that triggers batch flushes
+        self.__nextShard = itertools.count()
+        self.__local = threading.local()
+
+    # Sets the caps for a code (None means no limit); applies to every process using the store
+    # This process writes its usage of the code and hands its unused leases back first, so the new caps
+    # count from the stored totals. Other processes pick the caps up at their next lease refresh.
+    def setCaps(self, code, maxRedemptions=None, maxPerCustomer=None):
+        with self.__dbLock:
+            self.__connection.execute("INSERT OR REPLACE INTO promo_caps VALUES (?, ?, ?)",
+                                      (code, maxRedemptions, maxPerCustomer))
+        state = self.__codes.get(code)
+        if state is not None:
+            self.__flush([(code, state)], [key for key in list(self.__customers) if key[0] == code], True)
+            state.caps = (maxRedemptions, maxPerCustomer)
+
+    # Returns (maxRedemptions, maxPerCustomer) for a code
+    def getCaps(self, code):
+        return self.__getCode(code).caps
+
+    def __readCaps(self, code):
+        with self.__dbLock:
+            row = self.__connection.execute("SELECT max_redemptions, max_per_customer FROM promo_caps "
+                                            "WHERE code = ?", (code,)).fetchone()
+        return tuple(row) if row else (None, None)
+
+    # Re-reads a code's caps from the store, picking up setCaps calls made by other processes
+    def __refreshCaps(self, code, state):
+        state.caps = self.__readCaps(code)
+        return state.caps
+
+    def __getCode(self, code):
+        state = self.__codes.get(code)
+        if state is None:
+            with self.__codesLock:
+                state = self.__codes.get(code)
+                if state is None:
+                    state = self.__codes[code] = _CodeState(self.__readCaps(code), self.__shardCount)
+        return state
+
+    # Each thread keeps using the same shard index, spreading threads evenly over the shards
+    def __shardIndex(self):
+        index = getattr(self.__local, "shard", None)
+        if index is None:
+            index = self.__local.shard = next(self.__nextShard) % self.__shardCount
+        return index
+
+    # Atomically leases up to count redemptions of a (code, customer) counter; returns how many
+    def __lease(self, code, customer, cap, count):
+        with self.__dbLock:
+            connection = self.__connection
+            connection.execute("BEGIN IMMEDIATE")  # Holds the write lock across processes until COMMIT
+            try:
+                connection.execute("INSERT OR IGNORE INTO promo_usage (code, customer) VALUES (?, ?)", (code, customer))
+                leased = connection.execute("SELECT leased FROM promo_usage WHERE code = ? AND customer = ?",
+                                            (code, customer)).fetchone()[0]
+                granted = max(0, min(count, cap - leased))
+                if granted:
+                    connection.execute("UPDATE promo_usage SET leased = leased + ? WHERE code = ? AND customer = ?",
+                                       (granted, code, customer))
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+        return granted
+
+    # Takes one code-wide redemption from this thread's shard, refilling it when empty
+    def __takeCodeToken(self, code, state):
+        shard = state.shards[self.__shardIndex()]
+        while True:
+            with shard.lock:
+                limited = state.caps[0] is not None
+                if not limited or shard.remaining > 0:
+                    if limited:
+                        shard.remaining -= 1
+                    shard.used += 1
+                    return True
+            if not self.__refill(code, state, shard):
+                return False
+
+    # Refills an empty shard with a new lease, or with half of another shard's redemptions
+    def __refill(self, code, state, shard):
+        with state.leaseLock:  # Lease lock before shard locks, never the other way round
+            cap = self.__refreshCaps(code, state)[0]
+            if cap is None:
+                return True  # The cap was lifted; the caller takes its redemption without a lease
+            granted = self.__lease(code, '', cap, self.__leaseSize)
+            if not granted:
+                for other in state.shards:
+                    with other.lock:
+                        granted = (other.remaining + 1) // 2
+                        other.remaining -= granted
+                    if granted:
+                        break
+            if granted:
+                with shard.lock:
+                    shard.remaining += granted
+            return granted > 0
+
+    def __customerLock(self, key):
+        return self.__stripes[hash(key) % len(self.__stripes)]
+
+    # Redeems a code for a customer; returns False when a cap has been reached
+    def redeem(self, code, customerID):
+        state = self.__getCode(code)
+        key = (code, str(customerID))
+        allowance = None  # Set when a per-customer redemption was taken
+        if state.caps[1] is not None:
+            with self.__customerLock(key):
+                held = self.__customers.get(key)
+                if held is None:
+                    held = self.__customers[key] = [0, 0]
+                if held[0] == 0:
+                    maxPerCustomer = self.__refreshCaps(code, state)[1]
+                    if maxPerCustomer is not None:
+                        held[0] = self.__lease(code, key[1], maxPerCustomer, maxPerCustomer)
+                        if held[0] == 0:
+                            return False
+                if held[0] > 0:
+                    held[0] -= 1
+                    held[1] += 1
+                    allowance = held
+        if not self.__takeCodeToken(code, state):
+            if allowance is not None:  # Hand the customer's redemption back
+                with self.__customerLock(key):
+                    allowance[0] += 1
+                    allowance[1] -= 1
+            return False
+        if next(self.__pending) % self.__flushEvery == self.__flushEvery - 1:
+            self.flush()
+        return True
+
+    # Redemptions of a code recorded so far by every process (this process's unflushed ones included)
+    def getRedemptionCount(self, code, customerID=None):
+        customer = '' if customerID is None else str(customerID)
+        with self.__dbLock:
+            row = self.__connection.execute("SELECT used FROM promo_usage WHERE code = ? AND customer = ?",
+                                            (code, customer)).fetchone()
+        stored = row[0] if row else 0
+        if customerID is None:
+            state = self.__codes.get(code)
+            return stored + (sum(shard.used for shard in state.shards) if state else 0)
+        allowance = self.__customers.get((code, customer))
+        return stored + (allowance[1] if allowance else 0)
+
+    # Writes the usage counted since the last flush in one transaction
+    def flush(self, returnUnused=False):
+        with self.__codesLock:
+            codes = list(self.__codes.items())
+        self.__flush(codes, list(self.__customers), returnUnused)
+
+    # Writes the usage of the given codes and customer allowances, optionally returning their unused leases
+    def __flush(self, codes, customerKeys, returnUnused):
+        with self.__flushLock:
+            rows = []
+            for code, state in codes:
+                with state.leaseLock:
+                    used = unused = 0
+                    for shard in state.shards:
+                        with shard.lock:
+                            used += shard.used
+                            shard.used = 0
+                            if returnUnused:
+                                unused += shard.remaining
+                                shard.remaining = 0
+                if used or unused:
+                    rows.append((used, unused, code, ''))
+            for key in customerKeys:
+                with self.__customerLock(key):
+                    allowance = self.__customers[key]
+                    used, unused = allowance[1], allowance[0] if returnUnused else 0
+                    allowance[1] = 0
+                    allowance[0] -= unused
+                if used or unused:
+                    rows.append((used, unused, key[0], key[1]))
+            if rows:
+                with self.__dbLock:
+                    self.__connection.execute("BEGIN IMMEDIATE")
+                    self.__connection.executemany("INSERT OR IGNORE INTO promo_usage (code, customer) VALUES (?, ?)",
+                                                  [(code, customer) for _, _, code, customer in rows])
+                    self.__connection.executemany("UPDATE promo_usage SET used = used + ?, leased = leased - ? "
+                                                  "WHERE code = ? AND customer = ?", rows)
+                    self.__connection.execute("COMMIT")
+
+    # Flushes usage and hands leased but unused redemptions back to the other processes
+    def close(self):
+        self.flush(returnUnused=True)
+        self.__connection.close()
+
+
+# Redeems a code for many customers from one process of the stress test below
+def _redeemInProcess(filename, code, customers, results):
+    manager = PromoRedemptionManager(filename)
+    results.put(sum(manager.redeem(code, customer) for customer in customers))
+    manager.close()
+
+
+# Stress test: a flash promo hammered by many threads, then by several processes
+if __name__ == "__main__":
+    import multiprocessing
+    import os
+    import random
+    import sys
+    import tempfile
+    import time
+
+    sys.setswitchinterval(1e-6)  # Switch threads as often as possible to expose races
+    filename = os.path.join(tempfile.mkdtemp(), REDEMPTIONS_DB)
+    manager = PromoRedemptionManager(filename)
+    manager.setCaps("FLASH50", maxRedemptions=1000, maxPerCustomer=2)
+    manager.setCaps("LOYALTY", maxPerCustomer=1)
+
+    customers = [f"customer{i}" for i in range(700)]
+    successes = {}
+    attempted = set()
+    successesLock = threading.Lock()
+
+    def checkout(seed):
+        rng = random.Random(seed)
+        for _ in range(200):
+            customer = rng.choice(customers)
+            if manager.redeem("FLASH50", customer):
+                with successesLock:
+                    successes[customer] = successes.get(customer, 0) + 1
+            manager.redeem("LOYALTY", customer)
+            attempted.add(customer)
+
+    threads = [threading.Thread(target=checkout, args=(seed,)) for seed in range(32)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    manager.close()
+
+    total = sum(successes.values())
+    assert total == 1000, total
+    assert max(successes.values()) <= 2
+    manager = PromoRedemptionManager(filename)
+    assert manager.getRedemptionCount("FLASH50") == 1000
+    assert manager.getRedemptionCount("LOYALTY") == len(attempted)
+    print(f"32 threads, {32 * 200 * 2} redemption attempts in {elapsed * 1000:.0f} ms: "
+          f"FLASH50 redeemed {total}/1000, at most {max(successes.values())} per customer")
+
+    # Several checkout processes sharing one cap
+    manager.setCaps("FINALE", maxRedemptions=500)
+    manager.close()
+    results = multiprocessing.Queue()
+    processes = [multiprocessing.Process(target=_redeemInProcess,
+                                         args=(filename, "FINALE", [f"p{p}-{i}" for i in range(400)], results))
+                 for p in range(4)]
+    for process in processes:
+        process.start()
+    redeemed = sum(results.get() for _ in processes)
+    for process in processes:
+        process.join()
+    assert redeemed == 500, redeemed
+    print(f"4 processes x 400 attempts: FINALE redeemed {redeemed}/500, "
+          f"{PromoRedemptionManager(filename).getRedemptionCount('FINALE')} recorded")
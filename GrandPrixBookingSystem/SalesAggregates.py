@@ -0,0 +1,100 @@
+import threading
+
+# SalesAggregates class to keep running ticket counts and revenue per event and ticket type
+# Counters are updated as orders and payments come in, so reports never rescan the order list
+# Revenue counts only an order's current payment, and only once its status is "Processed"
+class SalesAggregates:
+    PROCESSED = "Processed"
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__tickets = {}  # event -> {ticketType: tickets sold}
+        self.__revenue = {}  # event -> {ticketType: amount paid}
+        self.__counted = {}  # order -> amount of its current payment included in the revenue
+
+    # Builds the counters from scratch out of an order list
+    @classmethod
+    def fromOrders(cls, orders):
+        aggregates = cls()
+        aggregates.recordOrders(orders)
+        for order in orders:
+            if order.getPayment() is not None:
+                aggregates.settlePayment(order, order.getPayment())
+        return aggregates
+
+    # Counts newly booked orders
+    def recordOrders(self, orders):
+        with self.__lock:
+            for order in orders:
+                counts = self.__tickets.setdefault(order.getEvent(), {})
+                counts[order.getTicketType()] = counts.get(order.getTicketType(), 0) + 1
+
+    # Sets an order's payment; whatever the previous payment added to the revenue is taken out,
+    # and the new payment is counted straight away if it is already processed
+    def replacePayment(self, order, payment):
+        with self.__lock:
+            order.setPayment(payment)
+            self.__addRevenue(order, -self.__counted.pop(order, 0))
+            self.__count(order, payment)
+
+    # Counts a payment once it has settled; returns False (and counts nothing) if it is no longer the order's payment
+    def settlePayment(self, order, payment):
+        with self.__lock:
+            if order.getPayment() is not payment:
+                return False
+            if order not in self.__counted:
+                self.__count(order, payment)
+            return True
+
+    def __count(self, order, payment):
+        if payment.getPaymentStatus() == self.PROCESSED:
+            amount = payment.getAmount() or 0
+            self.__counted[order] = amount
+            self.__addRevenue(order, amount)
+
+    def __addRevenue(self, order, amount):
+        totals = self.__revenue.setdefault(order.getEvent(), {})
+        totals[order.getTicketType()] = totals.get(order.getTicketType(), 0) + amount
+
+    # Returns tickets sold per event name
+    def getTicketsByEventName(self):
+        report = {}
+        with self.__lock:
+            for event, counts in self.__tickets.items():
+                name = event.getEventName()
+                report[name] = report.get(name, 0) + sum(counts.values())
+        return report
+
+    # Returns tickets and revenue per event name and ticket type
+    def getDetailedReport(self):
+        report = {}
+        with self.__lock:
+            for event, counts in self.__tickets.items():
+                byType = report.setdefault(event.getEventName(), {})
+                revenue = self.__revenue.get(event, {})
+                for ticketType, count in counts.items():
+                    line = byType.setdefault(ticketType, {"tickets": 0, "revenue": 0})
+                    line["tickets"] += count
+                    line["revenue"] += revenue.get(ticketType, 0)
+        return report
+
+    # Returns the raw counters, used to compare two aggregates
+    def snapshot(self):
+        with self.__lock:
+            tickets = {event: dict(counts) for event, counts in self.__tickets.items()}
+            revenue = {event: dict(totals) for event, totals in self.__revenue.items()}
+        return tickets, revenue
+
+    # Checks two aggregates hold the same counts and (to the cent) the same revenue
+    def matches(self, other):
+        tickets, revenue = self.snapshot()
+        otherTickets, otherRevenue = other.snapshot()
+        if tickets != otherTickets or revenue.keys() != otherRevenue.keys():
+            return False
+        for event, totals in revenue.items():
+            otherTotals = otherRevenue[event]
+            if totals.keys() != otherTotals.keys():
+                return False
+            if any(abs(amount - otherTotals[ticketType]) >= 0.005 for ticketType, amount in totals.items()):
+                return False
+        return True
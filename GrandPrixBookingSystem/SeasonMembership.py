@@ -1,3 +1,4 @@
+from bisect import bisect_left, bisect_right
 from datetime import date
 import pickle  # For saving/loading ticket objects
 
@@ -70,6 +71,42 @@ class SeasonMembership(Ticket):
     def getRemainingEvents(self, allEvents):
         return [event for event in allEvents if self.validFrom <= event["date"] <= self.validUntil and event["date"] >= date.today()]
 
+    # Sorts event dicts by date once, for getRemainingEventsSorted and remainingEventsForMembers
+    # Returns (dates, events) as two aligned lists; events on the same date keep their order
+    @staticmethod
+    def sortCalendar(allEvents):
+        events = sorted(allEvents, key=lambda event: event["date"])
+        return [event["date"] for event in events], events
+
+    # Same events as getRemainingEvents (in date order), found with two bisects over a sorted calendar
+    def getRemainingEventsSorted(self, calendar, today=None):
+        dates, events = calendar
+        low = bisect_left(dates, max(self.validFrom, today or date.today()))
+        high = bisect_right(dates, self.validUntil)
+        return events[low:high]
+
+    # Remaining events for every member at once, in the order of members
+    # Members are swept once by start date and once by end date, each pass moving a single
+    # pointer forward through the calendar, so the join costs O(members log members + events)
+    @staticmethod
+    def remainingEventsForMembers(members, calendar, today=None):
+        dates, events = calendar
+        today = today or date.today()
+        starts = [max(member.validFrom, today) for member in members]
+        lows = [0] * len(members)
+        position = 0
+        for i in sorted(range(len(members)), key=starts.__getitem__):
+            while position < len(dates) and dates[position] < starts[i]:
+                position += 1
+            lows[i] = position
+        highs = [0] * len(members)
+        position = 0
+        for i in sorted(range(len(members)), key=lambda i: members[i].validUntil):
+            while position < len(dates) and dates[position] <= members[i].validUntil:
+                position += 1
+            highs[i] = position
+        return [events[low:high] for low, high in zip(lows, highs)]
+
     # Extends base ticket details with membership-specific info
     def getTicketDetails(self):
         details = super().getTicketDetails()
@@ -82,53 +119,88 @@ class SeasonMembership(Ticket):
         return details
 
 # --- Testing the SeasonMembership class ---
-
-# Sample upcoming events
-upcoming_events = [
-    {"name": "Race 1", "date": date(2025, 6, 1)},
-    {"name": "Race 2", "date": date(2025, 7, 15)},
-    {"name": "Race 3", "date": date(2025, 10, 5)},
-    {"name": "Race 4", "date": date(2026, 1, 10)}
-]
-
-# Create SeasonMembership for Salama (VIP level)
-salama_ticket = SeasonMembership(
-    ticketID=3001,
-    basePrice=100.0,
-    eventDate=date(2025, 5, 20),
-    validFrom=date(2025, 6, 1),
-    validUntil=date(2025, 12, 31),
-    membershipLevel="VIP"
-)
-
-# Create SeasonMembership for Ghazlan (Standard level)
-ghazlan_ticket = SeasonMembership(
-    ticketID=3002,
-    basePrice=100.0,
-    eventDate=date(2025, 5, 20),
-    validFrom=date(2025, 6, 1),
-    validUntil=date(2025, 10, 31),
-    membershipLevel="Standard"
-)
-
-# Print ticket details and remaining events
-print("Salama Alneyadi's Season Membership:")
-print(salama_ticket.getTicketDetails())
-print("Remaining Events:", salama_ticket.getRemainingEvents(upcoming_events))
-
-print("\nGhazlan Alketbi's Season Membership:")
-print(ghazlan_ticket.getTicketDetails())
-print("Remaining Events:", ghazlan_ticket.getRemainingEvents(upcoming_events))
-
-# Save both tickets to a pickle file
-with open("season_tickets.pkl", "wb") as file:
-    pickle.dump([salama_ticket, ghazlan_ticket], file)
-
-# Load tickets back from pickle file
-with open("season_tickets.pkl", "rb") as file:
-    loaded_tickets = pickle.load(file)
-
-# Display loaded ticket details
-print("\nLoaded Season Membership Tickets from Pickle File:")
-for ticket in loaded_tickets:
-    print(ticket.getTicketDetails())
+if __name__ == "__main__":
+    # Sample upcoming events
+    upcoming_events = [
+        {"name": "Race 1", "date": date(2025, 6, 1)},
+        {"name": "Race 2", "date": date(2025, 7, 15)},
+        {"name": "Race 3", "date": date(2025, 10, 5)},
+        {"name": "Race 4", "date": date(2026, 1, 10)}
+    ]
+
+    # Create SeasonMembership for Salama (VIP level)
+    salama_ticket = SeasonMembership(
+        ticketID=3001,
+        basePrice=100.0,
+        eventDate=date(2025, 5, 20),
+        validFrom=date(2025, 6, 1),
+        validUntil=date(2025, 12, 31),
+        membershipLevel="VIP"
+    )
+
+    # Create SeasonMembership for Ghazlan (Standard level)
+    ghazlan_ticket = SeasonMembership(
+        ticketID=3002,
+        basePrice=100.0,
+        eventDate=date(2025, 5, 20),
+        validFrom=date(2025, 6, 1),
+        validUntil=date(2025, 10, 31),
+        membershipLevel="Standard"
+    )
+
+    # Print ticket details and remaining events
+    print("Salama Alneyadi's Season Membership:")
+    print(salama_ticket.getTicketDetails())
+    print("Remaining Events:", salama_ticket.getRemainingEvents(upcoming_events))
+
+    print("\nGhazlan Alketbi's Season Membership:")
+    print(ghazlan_ticket.getTicketDetails())
+    print("Remaining Events:", ghazlan_ticket.getRemainingEvents(upcoming_events))
+
+    # Save both tickets to a pickle file
+    with open("season_tickets.pkl", "wb") as file:
+        pickle.dump([salama_ticket, ghazlan_ticket], file)
+
+    # Load tickets back from pickle file
+    with open("season_tickets.pkl", "rb") as file:
+        loaded_tickets = pickle.load(file)
+
+    # Display loaded ticket details
+    print("\nLoaded Season Membership Tickets from Pickle File:")
+    for ticket in loaded_tickets:
+        print(ticket.getTicketDetails())
+
+    # Compare the per-member scan with the sorted calendar on a larger season
+    import random
+    import time
+    from datetime import timedelta
+
+    random.seed(17)
+    today = date.today()
+    calendar_events = [{"name": f"Race {i}", "date": today + timedelta(days=random.randint(-200, 500))} for i in range(1000)]
+    members = []
+    for i in range(5000):
+        valid_from = today + timedelta(days=random.randint(-300, 300))
+        members.append(SeasonMembership(4000 + i, 100.0, valid_from, valid_from,
+                                        valid_from + timedelta(days=random.randint(30, 365)), random.choice(["VIP", "Standard"])))
+
+    start = time.perf_counter()
+    expected = [member.getRemainingEvents(calendar_events) for member in members]
+    scan_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    calendar = SeasonMembership.sortCalendar(calendar_events)
+    sort_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    bisected = [member.getRemainingEventsSorted(calendar, today) for member in members]
+    bisect_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    swept = SeasonMembership.remainingEventsForMembers(members, calendar, today)
+    sweep_time = time.perf_counter() - start
+
+    key = lambda found: sorted(id(event) for event in found)
+    assert [key(found) for found in expected] == [key(found) for found in bisected] == [key(found) for found in swept]
+    print(f"\n{len(members)} members x {len(calendar_events)} events: scan {scan_time * 1000:.0f} ms | "
+          f"sort once {sort_time * 1000:.1f} ms | bisect {bisect_time * 1000:.1f} ms | sweep {sweep_time * 1000:.1f} ms")
@@ -0,0 +1,114 @@
+import heapq
+import itertools
+import threading
+import time
+
+# SeatHoldManager class to hold seats for a limited time while customers pay
+# Expiry times sit in a min-heap, so each sweep only touches holds that have expired;
+# confirmed or released holds are dropped from the heap lazily when their time comes
+class SeatHoldManager:
+    DEFAULT_TTL = 600  # Seconds a hold lasts without payment
+
+    def __init__(self, ttl=DEFAULT_TTL, clock=time.monotonic):
+        self.__ttl = ttl
+        self.__clock = clock
+        self.__lock = threading.Lock()
+        self.__holds = {}      # holdID -> [event, count, expiresAt]
+        self.__expiries = []   # heap of (expiresAt, holdID)
+        self.__holdIDs = itertools.count(1)
+        self.__sweeper = None
+        self.__stopSweeper = threading.Event()
+
+    # Holds seats on an event; returns a hold ID, or None if not enough seats are free
+    def placeHold(self, event, count, ttl=None):
+        with self.__lock:
+            if not event.holdTickets(count):
+                return None
+            holdID = next(self.__holdIDs)
+            expiresAt = self.__clock() + (ttl if ttl is not None else self.__ttl)
+            self.__holds[holdID] = [event, count, expiresAt]
+            heapq.heappush(self.__expiries, (expiresAt, holdID))
+            return holdID
+
+    # Cancels a hold and frees its seats
+    def releaseHold(self, holdID):
+        with self.__lock:
+            hold = self.__holds.pop(holdID, None)
+            if hold is None:
+                return False
+            hold[0].releaseHeldTickets(hold[1])
+            return True
+
+    # Turns a hold into a sale after payment; returns False if it already expired
+    def confirmHold(self, holdID):
+        with self.__lock:
+            hold = self.__holds.pop(holdID, None)
+            if hold is None:
+                return False
+            event, count, expiresAt = hold
+            if self.__clock() >= expiresAt:
+                event.releaseHeldTickets(count)
+                return False
+            event.confirmHeldTickets(count)
+            return True
+
+    # Checks whether a hold is still active
+    def isActive(self, holdID):
+        hold = self.__holds.get(holdID)
+        return hold is not None and self.__clock() < hold[2]
+
+    # Releases every expired hold; returns how many were released
+    def sweep(self, now=None):
+        now = self.__clock() if now is None else now
+        released = 0
+        with self.__lock:
+            while self.__expiries and self.__expiries[0][0] <= now:
+                _, holdID = heapq.heappop(self.__expiries)
+                hold = self.__holds.pop(holdID, None)
+                if hold is not None:  # Already confirmed or released otherwise
+                    hold[0].releaseHeldTickets(hold[1])
+                    released += 1
+        return released
+
+    # Runs sweep() every interval seconds on a background thread
+    def startSweeper(self, interval=1.0):
+        if self.__sweeper is not None:
+            return
+        self.__stopSweeper.clear()
+
+        def run():
+            while not self.__stopSweeper.wait(interval):
+                self.sweep()
+
+        self.__sweeper = threading.Thread(target=run, daemon=True)
+        self.__sweeper.start()
+
+    def stopSweeper(self):
+        if self.__sweeper is not None:
+            self.__stopSweeper.set()
+            self.__sweeper.join()
+            self.__sweeper = None
+
+    def __len__(self):
+        return len(self.__holds)
+
+
+# Example: holds that are paid become sales, the rest expire and free their seats
+if __name__ == "__main__":
+    from datetime import date
+    from Event import Event
+
+    event = Event(601, "Abu Dhabi Grand Prix", date(2025, 12, 7), "Yas Marina Circuit", 10)
+    holds = SeatHoldManager(ttl=0.2)
+
+    salamaHold = holds.placeHold(event, 4)
+    ghazlanHold = holds.placeHold(event, 5)
+    print("Third hold for 3 seats:", holds.placeHold(event, 3))  # Only 1 seat left
+    print("After holds:", event.getEventDetails())
+
+    print("Salama pays:", holds.confirmHold(salamaHold))
+    holds.startSweeper(interval=0.05)
+    time.sleep(0.4)  # Ghazlan never pays
+    holds.stopSweeper()
+    print("Ghazlan's hold still active:", holds.isActive(ghazlanHold))
+    print("After sweep:", event.getEventDetails())
@@ -0,0 +1,201 @@
+from array import array
+
+# SectionSeatMap class tracking which seats in one grandstand section are taken
+# Seats are stored as a bitmap (1 bit per seat, 1 = taken). A segment tree over the seats keeps,
+# for every range, the longest free run and the free runs touching each end, so a block of N
+# adjacent free seats is found in O(log seats). A blocked gap seat after every row keeps
+# blocks from wrapping onto the next row.
+class SectionSeatMap:
+    def __init__(self, name, rows, seatsPerRow):
+        self.__name = name
+        self.__rows = rows
+        self.__seatsPerRow = seatsPerRow
+        self.__bitmap = bytearray((rows * seatsPerRow + 7) // 8)
+        self.__buildTree()
+
+    def getName(self):
+        return self.__name
+
+    def getRows(self):
+        return self.__rows
+
+    def getSeatsPerRow(self):
+        return self.__seatsPerRow
+
+    # Only the bitmap is pickled; the tree is rebuilt from it
+    def __getstate__(self):
+        return {"name": self.__name, "rows": self.__rows, "seatsPerRow": self.__seatsPerRow, "bitmap": self.__bitmap}
+
+    def __setstate__(self, state):
+        self.__name = state["name"]
+        self.__rows = state["rows"]
+        self.__seatsPerRow = state["seatsPerRow"]
+        self.__bitmap = state["bitmap"]
+        self.__buildTree()
+
+    # Bitmap access by seat number (row * seatsPerRow + seat)
+    def __isTaken(self, seatNumber):
+        return self.__bitmap[seatNumber >> 3] >> (seatNumber & 7) & 1
+
+    def __setTaken(self, seatNumber, taken):
+        if taken:
+            self.__bitmap[seatNumber >> 3] |= 1 << (seatNumber & 7)
+        else:
+            self.__bitmap[seatNumber >> 3] &= ~(1 << (seatNumber & 7)) & 0xFF
+
+    # Tree leaf for a seat: one slot per seat plus one gap slot after each row
+    def __leafIndex(self, row, seat):
+        return row * (self.__seatsPerRow + 1) + seat
+
+    def __buildTree(self):
+        slots = self.__rows * (self.__seatsPerRow + 1)
+        size = 1
+        while size < slots:
+            size *= 2
+        self.__size = size
+        self.__prefix = array('i', bytes(4 * 2 * size))  # Free run starting at the left edge
+        self.__suffix = array('i', bytes(4 * 2 * size))  # Free run ending at the right edge
+        self.__best = array('i', bytes(4 * 2 * size))    # Longest free run inside the range
+        for row in range(self.__rows):
+            for seat in range(self.__seatsPerRow):
+                if not self.__isTaken(row * self.__seatsPerRow + seat):
+                    leaf = size + self.__leafIndex(row, seat)
+                    self.__prefix[leaf] = self.__suffix[leaf] = self.__best[leaf] = 1
+        width = 1
+        level = size // 2
+        while level >= 1:
+            for node in range(level, 2 * level):
+                self.__combine(node, width)
+            width *= 2
+            level //= 2
+
+    # Recomputes a node from its two children, each covering width slots
+    def __combine(self, node, width):
+        left, right = 2 * node, 2 * node + 1
+        prefix, suffix, best = self.__prefix, self.__suffix, self.__best
+        prefix[node] = prefix[left] if prefix[left] < width else width + prefix[right]
+        suffix[node] = suffix[right] if suffix[right] < width else width + suffix[left]
+        best[node] = max(best[left], best[right], suffix[left] + prefix[right])
+
+    def __updateSeat(self, row, seat, taken):
+        self.__setTaken(row * self.__seatsPerRow + seat, taken)
+        node = self.__size + self.__leafIndex(row, seat)
+        value = 0 if taken else 1
+        self.__prefix[node] = self.__suffix[node] = self.__best[node] = value
+        width = 1
+        node //= 2
+        while node >= 1:
+            self.__combine(node, width)
+            width *= 2
+            node //= 2
+
+    # Leftmost tree slot starting count adjacent free seats, or None
+    def __findBlock(self, count):
+        if count < 1 or self.__best[1] < count:
+            return None
+        node, start, width = 1, 0, self.__size
+        while node < self.__size:
+            width //= 2
+            left, right = 2 * node, 2 * node + 1
+            if self.__best[left] >= count:
+                node = left
+            elif self.__suffix[left] + self.__prefix[right] >= count:
+                return start + width - self.__suffix[left]
+            else:
+                node, start = right, start + width
+        return start
+
+    # Finds and takes count adjacent seats in the front-most row that fits; returns (row, seat) pairs
+    def allocate(self, count):
+        slot = self.__findBlock(count)
+        if slot is None:
+            return None
+        row, seat = divmod(slot, self.__seatsPerRow + 1)
+        seats = [(row, seat + i) for i in range(count)]
+        for row, seat in seats:
+            self.__updateSeat(row, seat, True)
+        return seats
+
+    # Takes one specific seat; returns False if it is already taken
+    def reserveSeat(self, row, seat):
+        if self.isTaken(row, seat):
+            return False
+        self.__updateSeat(row, seat, True)
+        return True
+
+    # Frees seats from a cancelled or expired booking
+    def release(self, seats):
+        for row, seat in seats:
+            self.__updateSeat(row, seat, False)
+
+    def isTaken(self, row, seat):
+        return bool(self.__isTaken(row * self.__seatsPerRow + seat))
+
+    # Largest block of adjacent free seats anywhere in the section
+    def getLargestFreeBlock(self):
+        return self.__best[1]
+
+    def getFreeSeatCount(self):
+        taken = sum(bin(byte).count("1") for byte in self.__bitmap)
+        return self.__rows * self.__seatsPerRow - taken
+
+
+# SeatMap class holding one SectionSeatMap per seat location used by SingleRacePass
+class SeatMap:
+    DEFAULT_LAYOUT = {"VIP": (10, 20), "Premium": (30, 40), "Standard": (100, 60)}  # (rows, seats per row)
+
+    def __init__(self, layout=None):
+        self.__sections = {name: SectionSeatMap(name, rows, seatsPerRow)
+                           for name, (rows, seatsPerRow) in (layout or self.DEFAULT_LAYOUT).items()}
+
+    # Looks a section up by seat location, ignoring case like SingleRacePass.calculatePrice
+    def getSection(self, seatLocation):
+        for name, section in self.__sections.items():
+            if name.lower() == seatLocation.lower():
+                return section
+        raise ValueError(f"Unknown seat location: {seatLocation}")
+
+    # Finds count adjacent seats in a section; returns labels like 'VIP-R3-S12', or None
+    def allocate(self, seatLocation, count):
+        section = self.getSection(seatLocation)
+        seats = section.allocate(count)
+        if seats is None:
+            return None
+        return [f"{section.getName()}-R{row + 1}-S{seat + 1}" for row, seat in seats]
+
+    # Seats a whole group together, sized by a GroupDiscount
+    def allocateGroup(self, seatLocation, groupDiscount):
+        return self.allocate(seatLocation, groupDiscount.getGroupSize())
+
+    # Frees seats given by their labels
+    def release(self, labels):
+        for label in labels:
+            name, row, seat = label.rsplit("-", 2)
+            self.getSection(name).release([(int(row[1:]) - 1, int(seat[1:]) - 1)])
+
+
+# Example: seat two groups together and show what is left
+if __name__ == "__main__":
+    import random
+    import time
+    from GroupDiscount import GroupDiscount
+
+    seatMap = SeatMap()
+    print("Salama's group of 5 (VIP):", seatMap.allocateGroup("VIP", GroupDiscount(5, 10.0)))
+    print("Ghazlan's group of 8 (VIP):", seatMap.allocateGroup("vip", GroupDiscount(8, 15.0)))
+    print("Block of 18 (VIP):", seatMap.allocate("VIP", 18))
+    vip = seatMap.getSection("VIP")
+    print("VIP free seats:", vip.getFreeSeatCount(), "| largest block:", vip.getLargestFreeBlock())
+
+    # Fill a large section randomly, then time best-available group searches
+    grandstand = SectionSeatMap("Standard", 1000, 100)
+    random.seed(3)
+    for row in range(grandstand.getRows()):
+        for seat in range(grandstand.getSeatsPerRow()):
+            if random.random() < 0.8:
+                grandstand.reserveSeat(row, seat)
+    start = time.perf_counter()
+    found = [grandstand.allocate(size) for size in (2, 4, 6, 8, 10) * 20]
+    elapsed = time.perf_counter() - start
+    print(f"100 group allocations in a 100k-seat section: {elapsed * 1000:.2f} ms, "
+          f"{sum(block is not None for block in found)} placed")
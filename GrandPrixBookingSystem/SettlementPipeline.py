@@ -0,0 +1,274 @@
+from concurrent.futures import Future
+import heapq
+import itertools
+import queue
+import random
+import threading
+import time
+from PaymentGateway import PaymentGateway, GatewayError
+
+# SettlementPipeline class settling payments in the background instead of inline with booking
+# submit() only queues a payment. Worker threads collect up to batchSize payments (waiting at
+# most maxWait seconds for a batch to fill) and send each batch to the gateway in one round trip.
+# Temporary failures are retried with exponential backoff and jitter, up to maxAttempts per payment.
+# The payment's status becomes "Processed" or "Failed", and the Future from submit() gets the result.
+# With an IdempotencyCache, a payment resubmitted under the same key after it settled or was declined
+# is not sent to the gateway again. Keys are claimed in the cache before sending, as IdempotencyCache.run
+# does, so two processes sharing the cache do not both send the same key.
+class SettlementPipeline:
+    STATUS_PROCESSED = "Processed"
+    STATUS_FAILED = "Failed"
+
+    def __init__(self, gateway, workers=4, batchSize=50, maxWait=0.01, maxAttempts=5, backoff=0.05, maxBackoff=2.0,
+                 idempotency=None):
+        self.__gateway = gateway
+        self.__idempotency = idempotency
+        self.__inFlight = {}  # idempotency key -> Future of the payment being settled under it
+        self.__batchSize = batchSize
+        self.__maxWait = maxWait
+        self.__maxAttempts = maxAttempts
+        self.__backoff = backoff
+        self.__maxBackoff = maxBackoff
+        self.__queue = queue.Queue()
+        self.__retries = []  # heap of (dueAt, order, item) waiting for their backoff to pass
+        self.__retryOrder = itertools.count()
+        self.__condition = threading.Condition()  # Guards the retry heap, counters and outstanding work
+        self.__outstanding = 0
+        self.__stats = {"settled": 0, "declined": 0, "failed": 0, "retries": 0, "batches": 0}
+        self.__running = True
+        self.__workers = [threading.Thread(target=self.__work, daemon=True) for _ in range(workers)]
+        self.__scheduler = threading.Thread(target=self.__scheduleRetries, daemon=True)
+        for thread in self.__workers + [self.__scheduler]:
+            thread.start()
+
+    # Queues a payment for settlement; returns a Future resolving to "Processed" or "Failed"
+    # A retry under an idempotencyKey that is settled, declined or still settling gets that payment's result
+    def submit(self, payment, idempotencyKey=None):
+        future = Future()
+        with self.__condition:
+            if not self.__running:
+                raise RuntimeError("Settlement pipeline has been stopped")
+            if idempotencyKey is not None:
+                running = self.__inFlight.get(idempotencyKey)
+                if running is not None:
+                    running.add_done_callback(lambda done: self.__setStatus(payment, done.result()))
+                    return running
+                if self.__idempotency is not None:
+                    # Checked under the condition: __finish caches a result and releases its key in one step
+                    found, status = self.__idempotency.get(idempotencyKey)
+                    if found:
+                        self.__setStatus(payment, status)
+                        future.set_result(status)
+                        return future
+                self.__inFlight[idempotencyKey] = future
+            self.__outstanding += 1
+        claimed = idempotencyKey is None or self.__idempotency is None  # Keys are claimed by the workers
+        self.__queue.put([payment, future, 0, idempotencyKey, claimed])  # [payment, future, attempts, key, claimed]
+        return future
+
+    # Collects one batch: blocks for the first payment, then waits up to maxWait for more
+    def __nextBatch(self):
+        item = self.__queue.get()
+        if item is None:
+            return None
+        batch = [item]
+        deadline = time.monotonic() + self.__maxWait
+        while len(batch) < self.__batchSize:
+            remaining = deadline - time.monotonic()
+            try:
+                item = self.__queue.get(timeout=remaining) if remaining > 0 else self.__queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                self.__queue.put(None)  # Leave the stop signal for this worker's next round
+                break
+            batch.append(item)
+        return batch
+
+    def __work(self):
+        while True:
+            batch = self.__nextBatch()
+            if batch is None:
+                return
+            batch = self.__claim(batch)
+            if not batch:
+                continue
+            for item in batch:
+                item[2] += 1
+            try:
+                results = list(self.__gateway.settleBatch([item[0] for item in batch]))
+                if len(results) != len(batch):
+                    raise ValueError(f"Gateway returned {len(results)} results for {len(batch)} payments")
+            except GatewayError:
+                results = [PaymentGateway.TEMPORARY_FAILURE] * len(batch)
+            except Exception:  # A broken gateway must not kill the worker (or leave payments unfinished); fail the batch
+                results = [None] * len(batch)
+            with self.__condition:
+                self.__stats["batches"] += 1
+            for item, result in zip(batch, results):
+                if result == PaymentGateway.TEMPORARY_FAILURE and item[2] < self.__maxAttempts:
+                    self.__scheduleRetry(item)
+                else:
+                    self.__finish(item, result)
+
+    # Claims the idempotency keys of a batch in the cache; returns the items that may be sent
+    # A key settled meanwhile finishes with the cached result, and a key another process is settling
+    # is looked at again after a backoff delay (its claim expires if that process died)
+    def __claim(self, batch):
+        ready = []
+        for item in batch:
+            if item[4]:
+                ready.append(item)
+                continue
+            key = item[3]
+            try:
+                found, status = self.__idempotency.get(key)
+                if not found:
+                    item[4] = self.__idempotency.claim(key)
+            except Exception:  # The cache could not be reached; fail the payment without sending it
+                self.__finish(item, None)
+                continue
+            if found:
+                self.__finish(item, PaymentGateway.SETTLED if status == self.STATUS_PROCESSED else PaymentGateway.DECLINED,
+                              cached=True)
+            elif item[4]:
+                ready.append(item)
+            else:
+                self.__scheduleRetry(item)
+        return ready
+
+    # Puts a payment back after a delay of backoff * 2^(attempt - 1), with jitter, capped at maxBackoff
+    def __scheduleRetry(self, item):
+        delay = min(self.__maxBackoff, self.__backoff * 2 ** (item[2] - 1)) * random.uniform(0.5, 1.0)
+        with self.__condition:
+            self.__stats["retries"] += 1
+            heapq.heappush(self.__retries, (time.monotonic() + delay, next(self.__retryOrder), item))
+            self.__condition.notify_all()
+
+    def __scheduleRetries(self):
+        with self.__condition:
+            while self.__running or self.__retries:
+                if not self.__retries:
+                    self.__condition.wait()
+                    continue
+                wait = self.__retries[0][0] - time.monotonic()
+                if wait > 0:
+                    self.__condition.wait(wait)
+                    continue
+                self.__queue.put(heapq.heappop(self.__retries)[2])
+
+    @staticmethod
+    def __setStatus(payment, status):
+        setStatus = getattr(payment, "setPaymentStatus", None)
+        if setStatus is not None:
+            setStatus(status)
+
+    # Records the final result of a payment (cached: the result was already in the idempotency cache)
+    # Only definitive answers (settled or declined) are cached under the idempotency key; after running out
+    # of retries or a gateway error the claim is just released, so a later retry goes to the gateway again.
+    # The cache is written and the in-flight key dropped under the condition, so submit() sees one or the other.
+    def __finish(self, item, result, cached=False):
+        payment, future, _, key, claimed = item
+        status = self.STATUS_PROCESSED if result == PaymentGateway.SETTLED else self.STATUS_FAILED
+        self.__setStatus(payment, status)
+        definitive = result in (PaymentGateway.SETTLED, PaymentGateway.DECLINED)
+        with self.__condition:
+            if key is not None and self.__idempotency is not None and claimed and not cached:
+                if definitive:
+                    self.__idempotency.put(key, status)
+                else:
+                    self.__idempotency.release(key)
+            if key is not None:
+                self.__inFlight.pop(key, None)
+            if not cached:
+                outcome = "settled" if result == PaymentGateway.SETTLED else "declined" if definitive else "failed"
+                self.__stats[outcome] += 1
+            self.__outstanding -= 1
+            self.__condition.notify_all()
+        future.set_result(status)
+
+    # Waits until every submitted payment has a final result; returns False on timeout
+    def drain(self, timeout=None):
+        with self.__condition:
+            return self.__condition.wait_for(lambda: self.__outstanding == 0, timeout)
+
+    # Settles everything already submitted, then stops the worker threads
+    def stop(self):
+        self.drain()
+        with self.__condition:
+            self.__running = False
+            self.__condition.notify_all()
+        for _ in self.__workers:
+            self.__queue.put(None)
+        for thread in self.__workers + [self.__scheduler]:
+            thread.join()
+
+    # Counters: settled, declined, failed (out of retries), retries and batches sent
+    def getStats(self):
+        with self.__condition:
+            return dict(self.__stats)
+
+
+# Benchmark: settling payments one round trip at a time versus through the pipeline
+if __name__ == "__main__":
+    from datetime import date
+    from CreditCardPayment import CreditCardPayment
+    from DigitalWalletPayment import DigitalWalletPayment
+    from PaymentGateway import LocalGateway
+
+    def makePayments(count):
+        payments = []
+        for i in range(count):
+            if i % 2:
+                payments.append(DigitalWalletPayment(5000 + i, 150.0, date(2025, 5, 10), f"wallet{i}", "Apple Pay",
+                                                     paymentStatus="Pending"))
+            else:
+                cvv = "12" if i % 50 == 0 else "123"  # A few invalid cards are declined
+                payments.append(CreditCardPayment(5000 + i, 200.0, date(2025, 5, 10), "1234567812345678",
+                                                  f"Customer {i}", date(2030, 1, 1), cvv))
+        return payments
+
+    count = 500
+    latency = 0.01
+
+    payments = makePayments(count)
+    gateway = LocalGateway(latency=latency, failureRate=0.05, seed=1)
+    start = time.perf_counter()
+    for payment in payments:  # One round trip per payment, as when settling inline with booking
+        while gateway.settleBatch([payment])[0] == PaymentGateway.TEMPORARY_FAILURE:
+            pass
+    inlineTime = time.perf_counter() - start
+
+    payments = makePayments(count)
+    gateway = LocalGateway(latency=latency, failureRate=0.05, batchFailureRate=0.05, seed=1)
+    pipeline = SettlementPipeline(gateway, workers=4, batchSize=50)
+    start = time.perf_counter()
+    futures = [pipeline.submit(payment) for payment in payments]
+    submitTime = time.perf_counter() - start
+    pipeline.stop()
+    pipelineTime = time.perf_counter() - start
+
+    stats = pipeline.getStats()
+    assert all(future.done() for future in futures)
+    assert stats["settled"] + stats["declined"] + stats["failed"] == count
+    assert all(payment.getPaymentStatus() in ("Processed", "Failed") for payment in payments)
+    print(f"{count} payments, {latency * 1000:.0f} ms per gateway round trip:")
+    print(f"Inline, one round trip each: {inlineTime:.2f} s")
+    print(f"Pipeline: queued in {submitTime * 1000:.1f} ms, all settled in {pipelineTime:.2f} s "
+          f"using {gateway.getRoundTrips()} round trips")
+    print("Pipeline stats:", stats)
+
+    # Clients retrying the same payments while they are still settling (and after)
+    import os
+    import tempfile
+    from IdempotencyCache import IdempotencyCache, IDEMPOTENCY_DB
+
+    gateway = LocalGateway(latency=0.05, seed=2)
+    pipeline = SettlementPipeline(gateway, idempotency=IdempotencyCache(os.path.join(tempfile.mkdtemp(), IDEMPOTENCY_DB)))
+    for attempt in range(3):
+        futures = [pipeline.submit(payment, f"order-{payment.getPaymentID()}") for payment in makePayments(100)]
+    pipeline.drain()
+    for payment in makePayments(100):
+        pipeline.submit(payment, f"order-{payment.getPaymentID()}")
+    pipeline.stop()
+    print(f"100 payments submitted 4 times: {gateway.getRoundTrips()} round trips, stats {pipeline.getStats()}")
@@ -0,0 +1,84 @@
+import os
+import pickle
+import struct
+import threading
+import zlib
+
+# Raised when a journal record does not fit the state it is replayed on (snapshot and log have diverged)
+class JournalReplayError(Exception):
+    pass
+
+
+# SystemJournal class to persist TicketingSystem changes as an append-only log
+# Each record is framed as (length, crc32, pickled (seq, kind, args)); a torn record
+# left by a crash fails its checksum and is dropped, together with anything after it
+class SystemJournal:
+    FRAME = struct.Struct(">II")
+
+    def __init__(self, filename, snapshotEvery=1000, sync=False):
+        self.__filename = filename          # Path of the log file
+        self.__snapshotEvery = snapshotEvery  # Records between automatic snapshots
+        self.__sync = sync                  # fsync after every record when True
+        self.__lock = threading.RLock()     # Serializes writers and snapshots
+        self.__file = None
+        self.__lastSeq = 0
+        self.__sinceSnapshot = 0
+
+    def getFilename(self):
+        return self.__filename
+
+    def getLock(self):
+        return self.__lock
+
+    def getLastSeq(self):
+        return self.__lastSeq
+
+    # Reads every intact record from the log and cuts off a torn tail
+    def readRecords(self):
+        records = []
+        if not os.path.exists(self.__filename):
+            return records
+        with open(self.__filename, 'rb') as file:
+            data = file.read()
+        offset = 0
+        while offset + self.FRAME.size <= len(data):
+            length, checksum = self.FRAME.unpack_from(data, offset)
+            body = data[offset + self.FRAME.size:offset + self.FRAME.size + length]
+            if len(body) < length or zlib.crc32(body) != checksum:
+                break
+            records.append(pickle.loads(body))
+            offset += self.FRAME.size + length
+        if offset < len(data):
+            with open(self.__filename, 'r+b') as file:
+                file.truncate(offset)
+        return records
+
+    # Opens the log for appending, continuing after the given sequence number
+    def open(self, lastSeq, pendingRecords=0):
+        self.__lastSeq = lastSeq
+        self.__sinceSnapshot = pendingRecords
+        self.__file = open(self.__filename, 'ab')
+
+    # Appends one record; returns True when a snapshot is due
+    def append(self, kind, args):
+        with self.__lock:
+            self.__lastSeq += 1
+            body = pickle.dumps((self.__lastSeq, kind, args), protocol=pickle.HIGHEST_PROTOCOL)
+            self.__file.write(self.FRAME.pack(len(body), zlib.crc32(body)) + body)
+            self.__file.flush()
+            if self.__sync:
+                os.fsync(self.__file.fileno())
+            self.__sinceSnapshot += 1
+            return self.__sinceSnapshot >= self.__snapshotEvery
+
+    # Empties the log once a snapshot covering every record has been written
+    def truncate(self):
+        with self.__lock:
+            self.__file.truncate(0)
+            self.__file.flush()
+            self.__sinceSnapshot = 0
+
+    def close(self):
+        if self.__file is not None:
+            self.__file.close()
+            self.__file = None
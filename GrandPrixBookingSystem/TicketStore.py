@@ -0,0 +1,199 @@
+from array import array
+from datetime import date
+from Ticket import Ticket
+from SingleRacePass import SingleRacePass
+from WeekendPackage import WeekendPackage
+from SeasonMembership import SeasonMembership
+
+# TicketStore class keeping a large ticket inventory as columns instead of one object per ticket
+# Numbers and dates live in typed arrays; repeated strings (seat location, package type, ...)
+# are stored once in a lookup table and referenced by a 2-byte code. get(row) returns a
+# lightweight view that behaves like the normal ticket class.
+class TicketStore:
+    BASE_COLUMNS = {"_ticketID": "id", "_basePrice": "price", "_eventDate": "date", "_isAvailable": "flag"}
+
+    def __init__(self, viewClass):
+        self.__viewClass = viewClass
+        self.__kinds = dict(self.BASE_COLUMNS, **viewClass.EXTRA_COLUMNS)
+        self.__columns = {name: self.__newColumn(kind) for name, kind in self.__kinds.items()}
+        self.__tables = {name: ([], {}) for name, kind in self.__kinds.items() if kind in ("text", "days")}
+        self.__size = 0
+
+    # Builds a store from existing ticket objects of the view's ticket class
+    @classmethod
+    def fromTickets(cls, viewClass, tickets):
+        store = cls(viewClass)
+        for ticket in tickets:
+            store.add(*[getattr(ticket, name) for name in viewClass.FIELD_ORDER])
+        return store
+
+    @staticmethod
+    def __newColumn(kind):
+        if kind == "id":
+            return array('q')
+        if kind == "price":
+            return array('d')
+        if kind == "date":
+            return array('i')  # date.toordinal()
+        if kind == "flag":
+            return bytearray()
+        return array('H')  # Code into the column's lookup table
+
+    # Turns a value into what its column stores
+    def __encode(self, name, value):
+        kind = self.__kinds[name]
+        if kind == "date":
+            return value.toordinal()
+        if kind == "flag":
+            return 1 if value else 0
+        if kind in ("text", "days"):
+            values, codes = self.__tables[name]
+            key = tuple(value) if kind == "days" else value
+            if key not in codes:
+                codes[key] = len(values)
+                values.append(key)
+            return codes[key]
+        return value
+
+    # Turns a stored column entry back into the ticket's value
+    def __decode(self, name, stored):
+        kind = self.__kinds[name]
+        if kind == "date":
+            return date.fromordinal(stored)
+        if kind == "flag":
+            return bool(stored)
+        if kind == "text":
+            return self.__tables[name][0][stored]
+        if kind == "days":
+            return list(self.__tables[name][0][stored])
+        return stored
+
+    # Appends a ticket using the same arguments as the ticket class constructor; returns its row
+    def add(self, *values):
+        defaults = self.__viewClass.FIELD_DEFAULTS
+        values = values + defaults[len(values) - (len(self.__viewClass.FIELD_ORDER) - len(defaults)):]
+        for name, value in zip(self.__viewClass.FIELD_ORDER, values):
+            self.__columns[name].append(self.__encode(name, value))
+        self.__size += 1
+        return self.__size - 1
+
+    def getViewClass(self):
+        return self.__viewClass
+
+    # Returns a raw column and, for coded columns, its lookup table (for bulk numeric work)
+    def getColumn(self, name):
+        table = self.__tables.get(name)
+        return self.__columns[name], (table[0] if table else None)
+
+    def getValue(self, name, row):
+        return self.__decode(name, self.__columns[name][row])
+
+    def setValue(self, name, row, value):
+        self.__columns[name][row] = self.__encode(name, value)
+
+    # Returns a view of one row
+    def get(self, row):
+        if not 0 <= row < self.__size:
+            raise IndexError("ticket row out of range")
+        return self.__viewClass(self, row)
+
+    def __len__(self):
+        return self.__size
+
+    def __iter__(self):
+        for row in range(self.__size):
+            yield self.__viewClass(self, row)
+
+
+# Builds a property that reads and writes one store column for the view's row
+def _column(name):
+    def getValue(self):
+        return self._store.getValue(name, self._row)
+
+    def setValue(self, value):
+        self._store.setValue(name, self._row, value)
+
+    return property(getValue, setValue)
+
+
+# Mixin turning a ticket class into a view over one TicketStore row
+# The ticket's own attributes become properties, so its methods run unchanged
+class StoredTicketView:
+    EXTRA_COLUMNS = {}
+    FIELD_ORDER = ("_ticketID", "_basePrice", "_eventDate", "_isAvailable")
+    FIELD_DEFAULTS = (True,)  # isAvailable
+
+    def __init__(self, store, row):
+        self._store = store
+        self._row = row
+
+    _ticketID = _column("_ticketID")
+    _basePrice = _column("_basePrice")
+    _eventDate = _column("_eventDate")
+    _isAvailable = _column("_isAvailable")
+
+
+class StoredTicket(StoredTicketView, Ticket):
+    pass
+
+
+class StoredSingleRacePass(StoredTicketView, SingleRacePass):
+    EXTRA_COLUMNS = {"_raceDay": "text", "_seatLocation": "text"}
+    FIELD_ORDER = ("_ticketID", "_basePrice", "_eventDate", "_raceDay", "_seatLocation", "_isAvailable")
+
+    _raceDay = _column("_raceDay")
+    _seatLocation = _column("_seatLocation")
+
+
+class StoredWeekendPackage(StoredTicketView, WeekendPackage):
+    EXTRA_COLUMNS = {"includedDays": "days", "packageType": "text"}
+    FIELD_ORDER = ("_ticketID", "_basePrice", "_eventDate", "includedDays", "packageType", "_isAvailable")
+
+    includedDays = _column("includedDays")
+    packageType = _column("packageType")
+
+
+class StoredSeasonMembership(StoredTicketView, SeasonMembership):
+    EXTRA_COLUMNS = {"validFrom": "date", "validUntil": "date", "membershipLevel": "text"}
+    FIELD_ORDER = ("_ticketID", "_basePrice", "_eventDate", "validFrom", "validUntil", "membershipLevel", "_isAvailable")
+
+    validFrom = _column("validFrom")
+    validUntil = _column("validUntil")
+    membershipLevel = _column("membershipLevel")
+
+
+# Memory benchmark: a grandstand of SingleRacePass objects versus the same tickets in a TicketStore
+if __name__ == "__main__":
+    import tracemalloc
+
+    count = 200000
+    locations = ["VIP", "Premium", "Standard", "Standard"]
+    days = ["Friday", "Saturday", "Sunday"]
+    raceDate = date(2025, 12, 7)
+
+    tracemalloc.start()
+    objects = [SingleRacePass(i, 200.0 + i % 50, raceDate, days[i % 3], locations[i % 4]) for i in range(count)]
+    objectBytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    store = TicketStore(StoredSingleRacePass)
+    for i in range(count):
+        store.add(i, 200.0 + i % 50, raceDate, days[i % 3], locations[i % 4])
+    storeBytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    print(f"{count} SingleRacePass objects: {objectBytes / 1e6:.1f} MB")
+    print(f"{count} tickets in a TicketStore: {storeBytes / 1e6:.1f} MB ({objectBytes / storeBytes:.0f}x smaller)")
+
+    # Views give the same answers as the original objects
+    for row in (0, 1, 12345, count - 1):
+        assert store.get(row).getTicketDetails() == objects[row].getTicketDetails()
+    print("Row 1 via view:", store.get(1).getTicketDetails())
+
+    weekend = TicketStore(StoredWeekendPackage)
+    weekend.add(2001, 300.0, raceDate, ["Friday", "Saturday", "Sunday"], "Premium")
+    season = TicketStore(StoredSeasonMembership)
+    season.add(3001, 100.0, date(2025, 5, 20), date(2025, 6, 1), date(2025, 12, 31), "VIP")
+    print("Weekend package price:", weekend.get(0).calculatePrice())
+    print("Season membership price:", season.get(0).calculatePrice())
@@ -1,23 +1,65 @@
 from datetime import date
+from contextlib import contextmanager, nullcontext
+import os
 import pickle
+import threading
+from UserRegistry import UserRegistry
+from EventSearchIndex import EventSearchIndex
+from EventDateIndex import EventDateIndex
+from InventoryManager import InventoryManager
+from SalesAggregates import SalesAggregates
+from SystemJournal import SystemJournal, JournalReplayError
 
 # Base class for users of the system
 class User:
+    __system = None  # Default for users pickled before they were linked to a system
+
     def __init__(self, username, password):
         self.__username = username
         self.__password = password
+        self.__registry = None  # Registry indexing this user, set by TicketingSystem
+        self.__system = None  # TicketingSystem journaling edits to this user, set by TicketingSystem
 
     def getUsername(self):
         return self.__username
 
     def setUsername(self, username):
-        self.__username = username
+        with self.editing("setUsername", username):
+            if self.__registry is not None:
+                self.__registry.reindexUsername(self, self.__username, username)
+            self.__username = username
 
     def getPassword(self):
         return self.__password
 
     def setPassword(self, password):
-        self.__password = password
+        with self.editing("setPassword", password):
+            self.__password = password
+
+    def getRegistry(self):
+        return self.__registry
+
+    def setRegistry(self, registry):
+        self.__registry = registry
+
+    def getSystem(self):
+        return self.__system
+
+    def setSystem(self, system):
+        self.__system = system
+
+    # Setters change the user inside this block, so a TicketingSystem can journal the edit
+    def editing(self, setter, value):
+        if self.__system is None:
+            return nullcontext()
+        return self.__system.journaledEdit(self, setter, value)
+
+    # The registry and system link are rebuilt on load, so they are never pickled with the user
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_User__registry"] = None
+        state["_User__system"] = None
+        return state
 
 # Customer inherits from User and adds email attribute
 class Customer(User):
@@ -29,10 +71,15 @@ class Customer(User):
         return self.__email
 
     def setEmail(self, email):
-        self.__email = email
+        with self.editing("setEmail", email):
+            if self.getRegistry() is not None:
+                self.getRegistry().reindexEmail(self, self.__email, email)
+            self.__email = email
 
 # Represents an event in the system
 class Event:
+    __system = None  # Default for events pickled before they were linked to a system
+
     def __init__(self, eventID, eventName, eventDate, location, totalCapacity, soldTickets):
         self.__eventID = eventID
         self.__eventName = eventName
@@ -40,42 +87,76 @@ class Event:
         self.__location = location
         self.__totalCapacity = totalCapacity
         self.__soldTickets = soldTickets
+        self.__system = None  # TicketingSystem indexing this event, set by TicketingSystem
 
     def getEventID(self):
         return self.__eventID
 
     def setEventID(self, eventID):
-        self.__eventID = eventID
+        with self.editing("setEventID", eventID):
+            if self.__system is not None:
+                self.__system.reindexEventID(self, self.__eventID, eventID)
+            self.__eventID = eventID
 
     def getEventName(self):
         return self.__eventName
 
     def setEventName(self, name):
-        self.__eventName = name
+        with self.editing("setEventName", name):
+            self.__eventName = name
+            if self.__system is not None:
+                self.__system.reindexEventText(self)
 
     def getEventDate(self):
         return self.__eventDate
 
     def setEventDate(self, eventDate):
-        self.__eventDate = eventDate
+        with self.editing("setEventDate", eventDate):
+            oldDate = self.__eventDate
+            self.__eventDate = eventDate
+            if self.__system is not None:
+                self.__system.reindexEventDate(self, oldDate)
 
     def getLocation(self):
         return self.__location
 
     def setLocation(self, location):
-        self.__location = location
+        with self.editing("setLocation", location):
+            self.__location = location
+            if self.__system is not None:
+                self.__system.reindexEventText(self)
+
+    def getSystem(self):
+        return self.__system
+
+    def setSystem(self, system):
+        self.__system = system
+
+    # Setters change the event inside this block, so its TicketingSystem can journal the edit
+    def editing(self, setter, value):
+        if self.__system is None:
+            return nullcontext()
+        return self.__system.journaledEdit(self, setter, value)
+
+    # The system link is restored on load, so it is never pickled with the event
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_Event__system"] = None
+        return state
 
     def getTotalCapacity(self):
         return self.__totalCapacity
 
     def setTotalCapacity(self, capacity):
-        self.__totalCapacity = capacity
+        with self.editing("setTotalCapacity", capacity):
+            self.__totalCapacity = capacity
 
     def getSoldTickets(self):
         return self.__soldTickets
 
     def setSoldTickets(self, sold):
-        self.__soldTickets = sold
+        with self.editing("setSoldTickets", sold):
+            self.__soldTickets = sold
 
     def getAvailableTickets(self):
         return self.__totalCapacity - self.__soldTickets
@@ -96,10 +177,13 @@ class Event:
 
 # Represents a customer's order for an event
 class Order:
+    __payment = None  # Default for orders pickled before payments were linked to them
+
     def __init__(self, event, ticketType, customer):
         self.__event = event
         self.__ticketType = ticketType
         self.__customer = customer
+        self.__payment = None
 
     def getEvent(self):
         return self.__event
@@ -110,6 +194,12 @@ class Order:
     def getCustomer(self):
         return self.__customer
 
+    def getPayment(self):
+        return self.__payment
+
+    def setPayment(self, payment):
+        self.__payment = payment
+
     def getOrderDetails(self):
         return {
             "event": self.__event.getEventDetails(),
@@ -119,9 +209,12 @@ class Order:
 
 # Represents payment made for an order
 class Payment:
+    __paymentStatus = "Processed"  # Default for payments pickled before background settlement
+
     def __init__(self, amount, paymentMethod):
         self.__amount = amount
         self.__paymentMethod = paymentMethod
+        self.__paymentStatus = "Processed"
 
     def getAmount(self):
         return self.__amount
@@ -129,10 +222,18 @@ class Payment:
     def getPaymentMethod(self):
         return self.__paymentMethod
 
+    # "Pending" while a SettlementPipeline is settling it, then "Processed" or "Failed"
+    def setPaymentStatus(self, status):
+        self.__paymentStatus = status
+
+    def getPaymentStatus(self):
+        return self.__paymentStatus
+
     def getPaymentInfo(self):
         return {
             "amount": self.__amount,
-            "paymentMethod": self.__paymentMethod
+            "paymentMethod": self.__paymentMethod,
+            "status": self.__paymentStatus
         }
 
 # Main ticketing system manager
@@ -141,76 +242,385 @@ class TicketingSystem:
         self.users = []   # List of all users
         self.events = []  # List of all events
         self.orders = []  # List of all orders
+        self.journalSeq = 0  # Last journal record already included in the saved snapshot
+        self.buildIndexes()
+
+    # Builds the lookup indexes derived from users, events and orders
+    def buildIndexes(self):
+        self.userRegistry = UserRegistry()  # Users keyed by username and email
+        for user in self.users:
+            if self.userRegistry.add(user):
+                user.setRegistry(self.userRegistry)
+            user.setSystem(self)  # Setter edits are journaled in journaled mode
+        self.eventsByID = {}  # Events keyed by event ID
+        for event in self.events:
+            self.eventsByID.setdefault(event.getEventID(), event)
+            event.setSystem(self)  # Setters keep the indexes below up to date
+        self.eventIndex = EventSearchIndex(self.events)  # Trigram index over names and locations
+        self.eventDates = EventDateIndex(self.events)  # Events ordered by date
+        self.inventory = InventoryManager()  # Striped locks making seat reservations atomic
+        self.sales = SalesAggregates.fromOrders(self.orders)  # Running sales counters
+        # Positions in the lists above, used by journal records to refer to objects
+        self.userPositions = {user: i for i, user in enumerate(self.users)}
+        self.eventPositions = {event: i for i, event in enumerate(self.events)}
+        self.orderPositions = {order: i for i, order in enumerate(self.orders)}
+        self.ordersLock = threading.Lock()  # Keeps order positions stable under concurrent bookings
+        self.journal = None  # SystemJournal when running in journaled mode
+        self.snapshotFilename = None
+        self.writeLock = nullcontext()  # Becomes the journal lock in journaled mode
+        self.snapshotDue = False  # Set when the journal asks for a snapshot; written once the change is done
+        # Bookings reserve seats under the inventory's striped locks, outside writeLock, so a snapshot waits
+        # for bookings that hold seats but have not journaled their orders yet
+        self.bookingGate = threading.Condition()
+        self.bookingsInFlight = 0
+        self.snapshotting = False
+        self.settlement = None  # SettlementPipeline settling payments in the background, if attached
+
+    # Only the core lists are pickled; indexes are rebuilt when loading
+    def __getstate__(self):
+        return {"users": self.users, "events": self.events, "orders": self.orders, "journalSeq": self.journalSeq}
+
+    def __setstate__(self, state):
+        self.journalSeq = 0  # Snapshots saved before journaling have no sequence number
+        self.__dict__.update(state)
+        self.buildIndexes()
 
     def registerCustomer(self, details):
-        customer = Customer(details["username"], details["password"], details["email"])
-        self.users.append(customer)
+        with self.writeLock:
+            customer = Customer(details["username"], details["password"], details["email"])
+            if not self.userRegistry.add(customer):
+                return None  # Avoid duplicate username or email
+            customer.setRegistry(self.userRegistry)
+            customer.setSystem(self)
+            self.userPositions[customer] = len(self.users)
+            self.users.append(customer)
+            self.__journalRecord("customer", dict(details))
+        self.__snapshotIfDue()
         return customer
 
     def loginUser(self, username, password):
-        for user in self.users:
-            if user.getUsername() == username and user.getPassword() == password:
-                return user
+        user = self.userRegistry.getByUsername(username)
+        if user and user.getPassword() == password:
+            return user
         return None
 
+    def getUser(self, username):
+        return self.userRegistry.getByUsername(username)
+
+    def getUserByEmail(self, email):
+        return self.userRegistry.getByEmail(email)
+
     def searchEvents(self, criteria):
-        results = []
-        for event in self.events:
-            if criteria.get("name") and criteria["name"].lower() in event.getEventDetails()["eventName"].lower():
-                results.append(event)
-        return results
+        results = None
+        for field in ("name", "location"):
+            if criteria.get(field):
+                matches = self.eventIndex.search(field, criteria[field])
+                if results is None:
+                    results = matches
+                else:
+                    matched = set(matches)
+                    results = [e for e in results if e in matched]
+        return results or []
+
+    def searchEventsByPrefix(self, prefix, field="name"):
+        return self.eventIndex.searchPrefix(field, prefix)
+
+    # Events dated between start and end inclusive, in date order
+    def getEventsBetween(self, start, end):
+        return self.eventDates.between(start, end)
+
+    # The next count events on or after fromDate (today by default)
+    def getUpcomingEvents(self, count, fromDate=None):
+        return self.eventDates.upcoming(count, fromDate)
 
     def bookTicket(self, event, ticketType, customer):
-        if event.getAvailableTickets() > 0:
-            event.updateSoldTickets(1)
+        self.__checkKnown([event], customer)
+        with self.__bookingInFlight():
+            if not self.inventory.reserve(event, 1):
+                return None
             order = Order(event, ticketType, customer)
-            self.orders.append(order)
-            return order
-        else:
-            return None
+            with self.writeLock:  # Only the order positions and the journal append are serialized
+                self.__appendOrders([order])
+                self.__journalRecord("book", (self.eventPositions.get(event), ticketType, self.userPositions.get(customer)))
+        self.__snapshotIfDue()
+        return order
+
+    # Books several tickets for one event together; returns None if they cannot all be booked
+    def bookTickets(self, event, ticketType, customer, quantity):
+        return self.bookCart(customer, [(event, ticketType, quantity)])
+
+    # Books a cart of (event, ticketType, quantity) items all-or-nothing
+    def bookCart(self, customer, items):
+        if any(quantity < 1 for _, _, quantity in items):
+            raise ValueError("Ticket quantity must be at least 1")
+        self.__checkKnown([event for event, _, _ in items], customer)
+        with self.__bookingInFlight():
+            if not self.inventory.reserveMany([(event, quantity) for event, _, quantity in items]):
+                return None
+            orders = [Order(event, ticketType, customer) for event, ticketType, quantity in items for _ in range(quantity)]
+            with self.writeLock:
+                self.__appendOrders(orders)
+                self.__journalRecord("cart", (self.userPositions.get(customer),
+                                              [(self.eventPositions.get(event), ticketType, quantity) for event, ticketType, quantity in items]))
+        self.__snapshotIfDue()
+        return orders
+
+    # Marks a booking as holding reserved seats until its orders are journaled; waits while a snapshot is written
+    @contextmanager
+    def __bookingInFlight(self):
+        with self.bookingGate:
+            self.bookingGate.wait_for(lambda: not self.snapshotting)
+            self.bookingsInFlight += 1
+        try:
+            yield
+        finally:
+            with self.bookingGate:
+                self.bookingsInFlight -= 1
+                self.bookingGate.notify_all()
+
+    # Journal records refer to events and customers by position, so in journaled mode bookings must use
+    # ones added to this system; without a journal any Event and customer can still be booked
+    def __checkKnown(self, events, customer):
+        if self.journal is None:
+            return
+        for event in events:
+            if event not in self.eventPositions:
+                raise ValueError(f"Event {event.getEventID()} has not been added to this system")
+        if customer is not None and customer not in self.userPositions:
+            raise ValueError(f"User {customer.getUsername()} is not registered in this system")
+
+    # Adds booked orders to the order list and the sales counters
+    def __appendOrders(self, orders):
+        with self.ordersLock:
+            for order in orders:
+                self.orderPositions[order] = len(self.orders)
+                self.orders.append(order)
+        self.sales.recordOrders(orders)
 
     def processPayment(self, order, paymentDetails):
         amount = paymentDetails.get("amount")
         method = paymentDetails.get("method")
-        payment = Payment(amount, method)
+        if self.journal is not None and order not in self.orderPositions:
+            raise ValueError("Order was not booked through this system")
+        if self.settlement is None:
+            return self.__recordPayment(order, amount, method, "Processed")
+        # Settle with the gateway in the background; revenue is counted once the payment is Processed
+        payment = self.__recordPayment(order, amount, method, "Pending")
+        self.settlement.submit(payment).add_done_callback(lambda done: self.__paymentSettled(order, payment))
+        return payment
+
+    # Sets a new payment on an order (replacing any earlier one) and journals it with its status
+    def __recordPayment(self, order, amount, method, status):
+        with self.writeLock:
+            payment = Payment(amount, method)
+            payment.setPaymentStatus(status)
+            self.sales.replacePayment(order, payment)
+            self.__journalRecord("payment", (self.orderPositions.get(order), amount, method, status))
+        self.__snapshotIfDue()
         return payment
 
+    # Counts a settled payment and journals its final status; runs on a settlement worker thread
+    def __paymentSettled(self, order, payment):
+        with self.writeLock:
+            if not self.sales.settlePayment(order, payment):
+                return  # The order was paid again before this payment settled
+            self.__journalRecord("settlement", (self.orderPositions.get(order), payment.getPaymentStatus()))
+        self.__snapshotIfDue()
+
+    # Sends payments to a SettlementPipeline instead of treating them as settled immediately
+    def attachSettlement(self, pipeline):
+        self.settlement = pipeline
+
+    # Tickets sold per event name, read from the running counters
     def generateSalesReport(self):
-        report = {}
-        for order in self.orders:
-            eventName = order.getOrderDetails()["event"]["eventName"]
-            if eventName in report:
-                report[eventName] += 1
-            else:
-                report[eventName] = 1
-        return report
+        return self.sales.getTicketsByEventName()
+
+    # Tickets and revenue per event name and ticket type
+    def generateDetailedSalesReport(self):
+        return self.sales.getDetailedReport()
+
+    # Rebuilds the counters from the order list and checks they match; optionally replaces them
+    def verifySalesAggregates(self, repair=False):
+        rebuilt = SalesAggregates.fromOrders(self.orders)
+        consistent = self.sales.matches(rebuilt)
+        if not consistent and repair:
+            self.sales = rebuilt
+        return consistent
 
     def saveSystem(self, filename="ticketing_system.pkl"):
-        with open(filename, 'wb') as f:
-            pickle.dump(self, f)
+        self.__writeSnapshot(filename)
         print(f"\nSystem saved to '{filename}'")
 
+    # Writes the whole system to a temporary file and swaps it in, then compacts the journal
+    # Bookings in flight finish first and new ones wait, so every reserved seat in the snapshot has its order
+    def __writeSnapshot(self, filename):
+        with self.bookingGate:
+            self.bookingGate.wait_for(lambda: not self.snapshotting)
+            self.snapshotting = True
+            self.bookingGate.wait_for(lambda: self.bookingsInFlight == 0)
+        try:
+            self.__writeSnapshotFile(filename)
+        finally:
+            with self.bookingGate:
+                self.snapshotting = False
+                self.bookingGate.notify_all()
+
+    def __writeSnapshotFile(self, filename):
+        with self.writeLock:
+            if self.journal is not None:
+                self.journalSeq = self.journal.getLastSeq()
+            tempFilename = filename + ".tmp"
+            with open(tempFilename, 'wb') as f:
+                pickle.dump(self, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tempFilename, filename)  # A crash before this line leaves the old snapshot intact
+            if self.journal is not None and filename == self.snapshotFilename:
+                self.journal.truncate()
+
     @staticmethod
-    def loadSystem(filename="ticketing_system.pkl"):
+    def loadSystem(filename="ticketing_system.pkl", journaled=False):
         try:
             with open(filename, 'rb') as f:
                 system = pickle.load(f)
                 print(f"\nSystem loaded from '{filename}'")
-                return system
         except FileNotFoundError:
             print("\nNo saved system found. Starting a new system.")
-            return TicketingSystem()
+            system = TicketingSystem()
+        if journaled:
+            system.attachJournal(SystemJournal(filename + ".log"), filename)
+        return system
+
+    # Replays the journal tail on top of the loaded snapshot and logs every later change to it
+    # Raises JournalReplayError if a record does not apply, rather than replaying later records on a diverged state
+    def attachJournal(self, journal, snapshotFilename):
+        lastSeq = self.journalSeq
+        pending = 0
+        for seq, kind, args in journal.readRecords():
+            if seq > self.journalSeq:  # Older records are already part of the snapshot
+                try:
+                    self.applyJournalRecord(kind, args)
+                except (JournalReplayError, ValueError) as error:
+                    raise JournalReplayError(f"Cannot replay record {seq} ({kind}) of "
+                                             f"'{journal.getFilename()}': {error}") from error
+                pending += 1
+            lastSeq = max(lastSeq, seq)
+        journal.open(lastSeq, pending)
+        self.journal = journal
+        self.snapshotFilename = snapshotFilename
+        self.writeLock = journal.getLock()
+
+    # Applies one journal record by repeating the change it describes
+    def applyJournalRecord(self, kind, args):
+        if kind == "customer":
+            if self.registerCustomer(args) is None:
+                raise JournalReplayError(f"user '{args['username']}' is already registered")
+        elif kind == "event":
+            if not self.addEvent(Event(*args)):
+                raise JournalReplayError(f"event {args[0]} already exists")
+        elif kind == "book":
+            eventPosition, ticketType, userPosition = args
+            self.__replayBooking(self.__userAt(userPosition), [(self.__at(self.events, eventPosition, "event"), ticketType, 1)])
+        elif kind == "cart":
+            userPosition, items = args
+            self.__replayBooking(self.__userAt(userPosition), [(self.__at(self.events, eventPosition, "event"), ticketType, quantity)
+                                                               for eventPosition, ticketType, quantity in items])
+        elif kind == "payment":
+            orderPosition, amount, method = args[:3]
+            status = args[3] if len(args) > 3 else "Processed"  # Records written before background settlement
+            self.__recordPayment(self.__at(self.orders, orderPosition, "order"), amount, method, status)
+        elif kind == "settlement":
+            orderPosition, status = args
+            order = self.__at(self.orders, orderPosition, "order")
+            order.getPayment().setPaymentStatus(status)
+            self.sales.settlePayment(order, order.getPayment())
+        elif kind == "edit":
+            target, position, setter, value = args
+            getattr(self.__at(self.users if target == "user" else self.events, position, target), setter)(value)
+        else:
+            raise JournalReplayError(f"unknown record kind '{kind}'")
+
+    # Repeats a journaled booking; it succeeded when it was made, so the seats are taken without an availability check
+    def __replayBooking(self, customer, items):
+        orders = []
+        for event, ticketType, quantity in items:
+            event.updateSoldTickets(quantity)
+            orders.extend(Order(event, ticketType, customer) for _ in range(quantity))
+        self.__appendOrders(orders)
+
+    def __userAt(self, position):
+        return self.__at(self.users, position, "user") if position is not None else None
+
+    # The object a journal record refers to by position
+    @staticmethod
+    def __at(objects, position, name):
+        if position is None or not 0 <= position < len(objects):
+            raise JournalReplayError(f"{name} position {position} is out of range ({len(objects)} {name}s)")
+        return objects[position]
+
+    # Runs a setter's change on a user or event under writeLock and journals it, so replay repeats the edit
+    @contextmanager
+    def journaledEdit(self, target, setter, value):
+        with self.writeLock:
+            yield  # A setter that raises (for example on a duplicate key) is not journaled
+            if isinstance(target, User):
+                self.__journalRecord("edit", ("user", self.userPositions.get(target), setter, value))
+            else:
+                self.__journalRecord("edit", ("event", self.eventPositions.get(target), setter, value))
+        self.__snapshotIfDue()
+
+    # Appends a record when journaling; once enough records have built up a snapshot becomes due
+    def __journalRecord(self, kind, args):
+        if self.journal is not None and self.journal.append(kind, args):
+            self.snapshotDue = True
+
+    # Writes a due snapshot; called after a change has released writeLock and left the booking gate
+    def __snapshotIfDue(self):
+        with self.bookingGate:
+            due, self.snapshotDue = self.snapshotDue, False
+        if due:
+            self.__writeSnapshot(self.snapshotFilename)
 
     def isUserRegistered(self, username):
-        return any(user.getUsername() == username for user in self.users)
+        return self.userRegistry.hasUsername(username)
 
     def addEvent(self, event):
-        for e in self.events:
-            if e.getEventID() == event.getEventID():
+        with self.writeLock:
+            if event.getEventID() in self.eventsByID:
                 return False  # Avoid duplicate event
-        self.events.append(event)
+            self.eventPositions[event] = len(self.events)
+            self.events.append(event)
+            self.eventsByID[event.getEventID()] = event
+            self.eventIndex.add(event)
+            self.eventDates.add(event)
+            event.setSystem(self)
+            self.__journalRecord("event", (event.getEventID(), event.getEventName(), event.getEventDate(),
+                                           event.getLocation(), event.getTotalCapacity(), event.getSoldTickets()))
+        self.__snapshotIfDue()
         return True
 
+    def getEvent(self, eventID):
+        return self.eventsByID.get(eventID)
+
+    # Moves an event to a new ID key (called by Event.setEventID before the ID changes)
+    def reindexEventID(self, event, oldID, newID):
+        with self.writeLock:
+            if self.eventsByID.get(newID, event) is not event:
+                raise ValueError(f"Event ID {newID} is already in use")
+            if self.eventsByID.get(oldID) is event:
+                del self.eventsByID[oldID]
+            self.eventsByID[newID] = event
+
+    # Re-indexes an event's name and location after one of them changed
+    def reindexEventText(self, event):
+        with self.writeLock:
+            self.eventIndex.update(event)
+
+    # Moves an event in the date index after its date changed
+    def reindexEventDate(self, event, oldDate):
+        with self.writeLock:
+            self.eventDates.update(event, oldDate)
+
 # Run a test scenario if this file is the main script
 if __name__ == "__main__":
     system = TicketingSystem.loadSystem()
@@ -223,7 +633,7 @@ if __name__ == "__main__":
             "email": "salama.alneyadi@example.com"
         })
     else:
-        salama = next(u for u in system.users if u.getUsername() == "Salama Alneyadi")
+        salama = system.getUser("Salama Alneyadi")
 
     if not system.isUserRegistered("Ghazlan Alketbi"):
         ghazlan = system.registerCustomer({
@@ -232,7 +642,7 @@ if __name__ == "__main__":
             "email": "ghazlan.alketbi@example.com"
         })
     else:
-        ghazlan = next(u for u in system.users if u.getUsername() == "Ghazlan Alketbi")
+        ghazlan = system.getUser("Ghazlan Alketbi")
 
     # Add some events (only if not already added)
     system.addEvent(Event(1, "Grand Prix Final", date(2025, 12, 1), "Yas Marina", 100, 0))
@@ -268,6 +678,10 @@ if __name__ == "__main__":
     for u in system.users:
         print(f"- {u.getUsername()} ({u.getEmail()})")
 
+    print("\nEvents in late November 2025:")
+    for e in system.getEventsBetween(date(2025, 11, 25), date(2025, 11, 30)):
+        print(f"- {e.getEventName()} | {e.getEventDate()}")
+
     print("\nAll Events:")
     for e in system.events:
         print(f"- {e.getEventName()} | {e.getEventDate()} | Sold: {e.getSoldTickets()}/{e.getTotalCapacity()}")
@@ -279,6 +693,7 @@ if __name__ == "__main__":
     print("\nSales Report:")
     for event, count in system.generateSalesReport().items():
         print(f"- {event}: {count} tickets sold")
+    print("Sales counters consistent:", system.verifySalesAggregates())
 
     # Save the current system state to a file
     system.saveSystem()
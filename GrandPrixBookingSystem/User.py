@@ -1,5 +1,16 @@
 import pickle  # For saving/loading binary data
 import os  # For checking file existence
+import atexit  # For flushing buffered sales on exit
+import threading  # For guarding the in-process sales buffer
+import time  # For the time-based flush trigger
+from contextlib import contextmanager
+try:
+    import fcntl  # File locking on Unix
+except ImportError:
+    fcntl = None
+    import msvcrt  # File locking on Windows
+
+SALES_FILE = 'sales_data.pkl'
 
 # Load users from file or return an empty list if the file does not exist
 def load_users():
@@ -15,15 +26,122 @@ def save_users(users):
 
 # Load sales data from file or return default data structure
 def load_sales_data():
-    if os.path.exists('sales_data.pkl'):
-        with open('sales_data.pkl', 'rb') as file:
+    if os.path.exists(SALES_FILE):
+        with open(SALES_FILE, 'rb') as file:
             return pickle.load(file)
     return {"total_sales": 0, "tickets_sold": 0, "discount": 0}
 
-# Save sales data to binary file
+# Save sales data to a temporary file and swap it in, so readers never see a half-written file
 def save_sales_data(data):
-    with open('sales_data.pkl', 'wb') as file:
+    temp_name = SALES_FILE + '.tmp'
+    with open(temp_name, 'wb') as file:
         pickle.dump(data, file)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temp_name, SALES_FILE)
+
+# Hold an exclusive lock shared by every process updating the sales file
+@contextmanager
+def sales_file_lock():
+    with open(SALES_FILE + '.lock', 'a+b') as lock_file:
+        if fcntl:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        else:
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+# Read-modify-write of the sales file under the cross-process lock
+def update_sales_data(change):
+    with sales_file_lock():
+        data = load_sales_data()
+        change(data)
+        save_sales_data(data)
+        return data
+
+# Buffers sales deltas in memory and adds them to the sales file in batches
+# A flush happens after flush_every orders, or flush_interval seconds after a sale was buffered
+class SalesAccumulator:
+    def __init__(self, flush_every=100, flush_interval=5.0):
+        self._flush_every = flush_every  # Orders buffered before a flush
+        self._flush_interval = flush_interval  # Seconds allowed between flushes
+        self._lock = threading.Lock()
+        self._pending_tickets = 0
+        self._pending_sales = 0
+        self._pending_orders = 0
+        self._last_flush = time.monotonic()
+        self._timer = None  # Background flush for sales buffered while no more orders arrive
+
+    # Record one order's tickets and payment, flushing when a trigger is reached
+    def add_sale(self, tickets_count, payment_amount):
+        with self._lock:
+            self._pending_tickets += tickets_count
+            self._pending_sales += payment_amount
+            self._pending_orders += 1
+            due = (self._pending_orders >= self._flush_every or
+                   time.monotonic() - self._last_flush >= self._flush_interval)
+            if not due and self._timer is None:
+                self._start_timer()
+        if due:
+            self.flush()
+
+    # Schedule a flush flush_interval seconds from now (called with the lock held)
+    def _start_timer(self):
+        self._timer = threading.Timer(self._flush_interval, self._flush_on_timer)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _flush_on_timer(self):
+        with self._lock:
+            self._timer = None
+        try:
+            self.flush()
+        except Exception as e:
+            print(f"Error flushing sales data: {e}")  # The deltas stay buffered and the flush is retried
+
+    # Add all buffered deltas to the file in one locked read-modify-write
+    # If the write fails the deltas are put back, so the next flush still includes them
+    def flush(self):
+        with self._lock:
+            tickets, sales, orders = self._pending_tickets, self._pending_sales, self._pending_orders
+            self._pending_tickets = self._pending_sales = self._pending_orders = 0
+            self._last_flush = time.monotonic()
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        if tickets or sales:
+            def apply(data):
+                data["tickets_sold"] += tickets
+                data["total_sales"] += sales
+            try:
+                update_sales_data(apply)
+            except Exception:
+                with self._lock:
+                    self._pending_tickets += tickets
+                    self._pending_sales += sales
+                    self._pending_orders += orders
+                    if self._timer is None:
+                        self._start_timer()
+                raise
+
+    # Sales data on disk plus anything still buffered in this process
+    def get_live_data(self):
+        data = load_sales_data()
+        with self._lock:
+            data["tickets_sold"] += self._pending_tickets
+            data["total_sales"] += self._pending_sales
+        return data
+
+# Shared accumulator for this process; whatever is still buffered is written on exit
+sales_accumulator = SalesAccumulator()
+atexit.register(sales_accumulator.flush)
 
 # Base class for all users
 class User:
@@ -128,10 +246,7 @@ class Customer(User):
     def placeOrder(self, tickets_count, payment_amount):
         order = {"tickets": tickets_count, "payment": payment_amount}
         self._orderHistory.append(order)
-        sales_data = load_sales_data()
-        sales_data["tickets_sold"] += tickets_count
-        sales_data["total_sales"] += payment_amount
-        save_sales_data(sales_data)
+        sales_accumulator.add_sale(tickets_count, payment_amount)
         return {"status": "Order successful"}
 
     # Method to return customer info as a string
@@ -151,16 +266,14 @@ class Admin(User):
     def set_staffID(self, staff_id):
         self._staffID = staff_id
 
-    # Method to view the current sales report
+    # Method to view the current sales report, including sales not yet flushed
     def viewSalesReport(self):
-        return load_sales_data()
+        return sales_accumulator.get_live_data()
 
     # Method to modify the discount rate in the sales data
     def modifyDiscounts(self, discount):
         try:
-            sales_data = load_sales_data()
-            sales_data["discount"] = discount
-            save_sales_data(sales_data)
+            update_sales_data(lambda sales_data: sales_data.update(discount=discount))
             return True
         except Exception as e:
             print(f"Error modifying discount: {e}")
@@ -168,7 +281,7 @@ class Admin(User):
 
     # Method to track number of tickets sold
     def trackTicketSales(self):
-        sales_data = load_sales_data()
+        sales_data = sales_accumulator.get_live_data()
         return sales_data.get("tickets_sold", 0)
 
     # Method to return a list of all Customer users
@@ -0,0 +1,55 @@
+# UserRegistry class to index users by username and email for constant-time lookups
+class UserRegistry:
+    def __init__(self):
+        self.__byUsername = {}  # username -> user
+        self.__byEmail = {}     # email -> user
+
+    # Adds a user to both indexes, refusing duplicate usernames or emails
+    def add(self, user):
+        if user.getUsername() in self.__byUsername or user.getEmail() in self.__byEmail:
+            return False
+        self.__byUsername[user.getUsername()] = user
+        self.__byEmail[user.getEmail()] = user
+        return True
+
+    # Removes a user from both indexes
+    def remove(self, user):
+        if self.__byUsername.get(user.getUsername()) is user:
+            del self.__byUsername[user.getUsername()]
+        if self.__byEmail.get(user.getEmail()) is user:
+            del self.__byEmail[user.getEmail()]
+
+    # Returns the user registered under this username, or None
+    def getByUsername(self, username):
+        return self.__byUsername.get(username)
+
+    # Returns the user registered under this email, or None
+    def getByEmail(self, email):
+        return self.__byEmail.get(email)
+
+    # Checks whether a username is taken
+    def hasUsername(self, username):
+        return username in self.__byUsername
+
+    # Checks whether an email is taken
+    def hasEmail(self, email):
+        return email in self.__byEmail
+
+    # Moves a user to a new username key (called before the username changes)
+    def reindexUsername(self, user, oldUsername, newUsername):
+        if self.__byUsername.get(newUsername, user) is not user:
+            raise ValueError(f"Username '{newUsername}' is already registered")
+        if self.__byUsername.get(oldUsername) is user:
+            del self.__byUsername[oldUsername]
+        self.__byUsername[newUsername] = user
+
+    # Moves a user to a new email key (called before the email changes)
+    def reindexEmail(self, user, oldEmail, newEmail):
+        if self.__byEmail.get(newEmail, user) is not user:
+            raise ValueError(f"Email '{newEmail}' is already registered")
+        if self.__byEmail.get(oldEmail) is user:
+            del self.__byEmail[oldEmail]
+        self.__byEmail[newEmail] = user
+
+    def __len__(self):
+        return len(self.__byUsername)
@@ -0,0 +1,193 @@
+import asyncio
+import json
+
+
+# Raised when a provider cannot be reached or gives an unusable answer
+class WalletProviderError(Exception):
+    pass
+
+
+# Keep-alive connections to one provider
+# At most maxConnections are open at once; a request waits for a free one, so this is also the
+# provider's concurrency limit. Idle connections are reused, newest first.
+class _ConnectionPool:
+    def __init__(self, host, port, maxConnections, connectTimeout):
+        self.host = host
+        self.port = port
+        self.__connectTimeout = connectTimeout
+        self.__slots = asyncio.Semaphore(maxConnections)
+        self.__idle = []  # (reader, writer) ready for the next request
+        self.opened = 0
+
+    async def acquire(self):
+        await self.__slots.acquire()
+        while self.__idle:
+            reader, writer = self.__idle.pop()
+            if not writer.is_closing() and not reader.at_eof():
+                return reader, writer, True
+            writer.close()
+        try:
+            reader, writer = await asyncio.wait_for(asyncio.open_connection(self.host, self.port), self.__connectTimeout)
+        except BaseException:
+            self.__slots.release()
+            raise
+        self.opened += 1
+        return reader, writer, False
+
+    # Returns a connection to the pool, or closes it after an error
+    def release(self, reader, writer, reusable):
+        if reusable:
+            self.__idle.append((reader, writer))
+        else:
+            writer.close()
+        self.__slots.release()
+
+    def close(self):
+        for _, writer in self.__idle:
+            writer.close()
+        self.__idle.clear()
+
+
+# WalletProviderClient class settling DigitalWalletPayment objects with their wallet provider over asyncio
+# Each provider ("PayPal", "Apple Pay", ...) gets its own pool of keep-alive HTTP connections, limited to
+# maxConnections, and every request has a timeout. Payments are coroutines rather than threads, so thousands
+# can be in flight from one process. The payment ID is sent as the Idempotency-Key, so a request retried
+# after a dropped connection is not charged twice. A provider that times out may still charge the payment,
+# so the client asks again under the same key (up to timeoutRetries times) to learn the real outcome, and
+# leaves the payment "Pending" if it still has no answer.
+class WalletProviderClient:
+    def __init__(self, providers, maxConnections=50, timeout=5.0, connectTimeout=2.0, timeoutRetries=2):
+        # providers maps provider name -> (host, port)
+        self.__pools = {name: _ConnectionPool(host, port, maxConnections, connectTimeout)
+                        for name, (host, port) in providers.items()}
+        self.__timeout = timeout
+        self.__timeoutRetries = timeoutRetries
+
+    # Connections opened so far per provider
+    def getConnectionCounts(self):
+        return {name: pool.opened for name, pool in self.__pools.items()}
+
+    # Writes one request and reads the answer's status line and body
+    @staticmethod
+    async def __exchange(reader, writer, host, body, idempotencyKey):
+        writer.write(f"POST /payments HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+                     f"Idempotency-Key: {idempotencyKey}\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body)
+        await writer.drain()
+        statusLine = await reader.readline()
+        if not statusLine:
+            raise ConnectionResetError("provider closed the connection")
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        return statusLine, await reader.readexactly(int(headers.get("content-length", 0)))
+
+    # Sends one request on a pooled connection and returns the decoded JSON answer (None if it is not valid JSON)
+    # The timeout covers the exchange with the provider, not the wait for a free connection
+    async def __post(self, pool, body, idempotencyKey):
+        for attempt in range(2):
+            reader, writer, reused = await pool.acquire()
+            reusable = False
+            try:
+                statusLine, answer = await asyncio.wait_for(
+                    self.__exchange(reader, writer, pool.host, body, idempotencyKey), self.__timeout)
+                reusable = True
+            except (ConnectionError, asyncio.IncompleteReadError) as error:
+                if reused and attempt == 0:
+                    continue  # The idle connection had gone stale; try once on a fresh one
+                raise WalletProviderError(f"connection to {pool.host}:{pool.port} failed: {error}") from error
+            finally:
+                pool.release(reader, writer, reusable)
+            code = statusLine.split()[1] if len(statusLine.split()) > 1 else b""
+            if code != b"200":
+                raise WalletProviderError(f"provider answered {statusLine.decode('latin-1').strip()}")
+            try:
+                return json.loads(answer)
+            except ValueError:
+                return None
+
+    # Settles a wallet payment with its provider; sets the payment status and returns a message
+    # The status stays "Pending" when the outcome is unknown (no answer in time, or an unreadable one);
+    # processing the payment again later asks the provider under the same idempotency key
+    async def processPayment(self, payment):
+        pool = self.__pools.get(payment.getProvider())
+        if pool is None:
+            payment.setPaymentStatus("Failed")
+            return f"Digital wallet payment failed: no client configured for {payment.getProvider()}."
+        body = json.dumps({"paymentID": payment.getPaymentID(), "walletID": payment.getWalletID(),
+                           "amount": payment.getAmount()}).encode()
+        for attempt in range(self.__timeoutRetries + 1):
+            try:
+                answer = await self.__post(pool, body, payment.getPaymentID())
+                break
+            except asyncio.TimeoutError:
+                continue  # The provider may still charge it; ask again under the same key
+            except WalletProviderError as error:
+                payment.setPaymentStatus("Failed")
+                return f"Digital wallet payment failed via {payment.getProvider()}: {error}"
+        else:
+            payment.setPaymentStatus("Pending")
+            return f"Digital wallet payment via {payment.getProvider()} is pending: no answer in time."
+        status = answer.get("status") if isinstance(answer, dict) else None
+        if status not in ("Processed", "Failed"):
+            payment.setPaymentStatus("Pending")
+            return f"Digital wallet payment via {payment.getProvider()} is pending: unreadable answer from the provider."
+        payment.setPaymentStatus(status)
+        if payment.getPaymentStatus() == "Processed":
+            return f"Digital wallet payment of {payment.getAmount()} processed successfully via {payment.getProvider()}."
+        return f"Digital wallet payment of {payment.getAmount()} declined by {payment.getProvider()}."
+
+    # Settles many payments concurrently; returns their messages in order
+    async def processPayments(self, payments):
+        return await asyncio.gather(*(self.processPayment(payment) for payment in payments))
+
+    async def close(self):
+        for pool in self.__pools.values():
+            pool.close()
+
+
+# Example: thousands of wallet payments in flight from one thread against local provider stubs
+if __name__ == "__main__":
+    import threading
+    import time
+    from datetime import date
+    from DigitalWalletPayment import DigitalWalletPayment
+    from WalletProviderStub import WalletProviderStub
+
+    async def main():
+        paypal, applePay, slowPay = WalletProviderStub(latency=0.02), WalletProviderStub(latency=0.02), WalletProviderStub(latency=1.0)
+        providers = {"PayPal": ("127.0.0.1", await paypal.start()),
+                     "Apple Pay": ("127.0.0.1", await applePay.start()),
+                     "SlowPay": ("127.0.0.1", await slowPay.start())}
+        client = WalletProviderClient(providers, maxConnections=50, timeout=0.5)
+
+        payments = [DigitalWalletPayment(9000 + i, 150.0, date(2025, 5, 10), f"wallet{i}",
+                                         "PayPal" if i % 2 else "Apple Pay", paymentStatus="Pending") for i in range(5000)]
+        start = time.perf_counter()
+        messages = await client.processPayments(payments)
+        elapsed = time.perf_counter() - start
+        assert all(payment.getPaymentStatus() == "Processed" for payment in payments)
+        print(f"{len(payments)} wallet payments in {elapsed:.2f} s on {threading.active_count()} thread(s), "
+              f"connections opened: {client.getConnectionCounts()}")
+        print("PayPal stub:", paypal.getStats())
+        print(messages[0])
+
+        # Retrying with the same payment IDs is answered from the provider's idempotency record
+        await client.processPayments(payments[:10])
+        print("PayPal stub after 10 retries:", paypal.getStats())
+
+        # A provider slower than the timeout is asked again under the same key until it has the outcome,
+        # without blocking the others; an unknown provider fails the payment
+        slow = DigitalWalletPayment(9999, 80.0, date(2025, 5, 10), "wallet-slow", "SlowPay", paymentStatus="Pending")
+        unknown = DigitalWalletPayment(9998, 80.0, date(2025, 5, 10), "wallet-x", "Samsung Pay", paymentStatus="Pending")
+        for message in await client.processPayments([slow, unknown]):
+            print(message)
+
+        await client.close()
+        for stub in (paypal, applePay, slowPay):
+            await stub.stop()
+
+    asyncio.run(main())
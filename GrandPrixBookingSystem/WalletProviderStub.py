@@ -0,0 +1,100 @@
+import asyncio
+import json
+import random
+
+
+# WalletProviderStub class: a local asyncio HTTP server standing in for a wallet provider (PayPal, Apple Pay, ...)
+# Accepts POST /payments with a JSON body over keep-alive connections, waits latency seconds and answers
+# {"status": "Processed"} or {"status": "Failed"}. A repeated Idempotency-Key gets the first answer back.
+class WalletProviderStub:
+    def __init__(self, latency=0.02, failureRate=0.0, seed=None):
+        self.__latency = latency
+        self.__failureRate = failureRate
+        self.__random = random.Random(seed)
+        self.__server = None
+        self.__handlers = set()    # Tasks serving open connections
+        self.__answers = {}        # Idempotency-Key -> status already given
+        self.__openConnections = 0
+        self.__peakConnections = 0
+        self.__connectionsAccepted = 0
+        self.__requests = 0
+
+    # Starts listening; port 0 picks a free port. Returns the port.
+    async def start(self, host="127.0.0.1", port=0):
+        self.__server = await asyncio.start_server(self.__serve, host, port)
+        return self.__server.sockets[0].getsockname()[1]
+
+    # Stops listening and drops open connections
+    async def stop(self):
+        self.__server.close()
+        for handler in self.__handlers:
+            handler.cancel()
+        await asyncio.gather(*self.__handlers, return_exceptions=True)
+        await self.__server.wait_closed()
+
+    # Counters: requests handled, connections accepted and the most open at once
+    def getStats(self):
+        return {"requests": self.__requests, "connections": self.__connectionsAccepted,
+                "peakConnections": self.__peakConnections}
+
+    async def __serve(self, reader, writer):
+        self.__handlers.add(asyncio.current_task())
+        self.__openConnections += 1
+        self.__connectionsAccepted += 1
+        self.__peakConnections = max(self.__peakConnections, self.__openConnections)
+        try:
+            while True:
+                requestLine = await reader.readline()
+                if not requestLine:
+                    break  # Client closed the connection
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+                self.__requests += 1
+                status, answer = await self.__answer(requestLine, headers, body)
+                payload = json.dumps(answer).encode()
+                writer.write(f"HTTP/1.1 {status}\r\nContent-Type: application/json\r\n"
+                             f"Content-Length: {len(payload)}\r\n\r\n".encode() + payload)
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.CancelledError):
+            pass  # Client went away, or stop() dropped the connection
+        finally:
+            self.__openConnections -= 1
+            self.__handlers.discard(asyncio.current_task())
+            writer.close()
+
+    async def __answer(self, requestLine, headers, body):
+        method, path = requestLine.decode("latin-1").split()[:2]
+        if method != "POST" or path != "/payments":
+            return "404 Not Found", {"error": "unknown endpoint"}
+        key = headers.get("idempotency-key")
+        if key in self.__answers:
+            return "200 OK", {"status": self.__answers[key], "replayed": True}
+        await asyncio.sleep(self.__latency)
+        if key in self.__answers:  # Same key finished while this request was waiting
+            return "200 OK", {"status": self.__answers[key], "replayed": True}
+        payment = json.loads(body)
+        failed = payment.get("amount", 0) <= 0 or self.__random.random() < self.__failureRate
+        status = "Failed" if failed else "Processed"
+        if key is not None:
+            self.__answers[key] = status
+        return "200 OK", {"status": status}
+
+
+# Runs a stub provider on a fixed port until interrupted
+if __name__ == "__main__":
+    async def main():
+        stub = WalletProviderStub(latency=0.05)
+        port = await stub.start(port=8765)
+        print(f"Wallet provider stub listening on 127.0.0.1:{port}")
+        await asyncio.Event().wait()
+
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass